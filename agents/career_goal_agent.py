@@ -10,10 +10,14 @@ Versiyon: 1.0.0
 """
 
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from typing import Dict, List, Optional
 import json
 
 
+PLAN_KEYS = ("adımlar", "gerekli_beceriler", "önerilen_egitim", "deneyim")
+
+
 class CareerGoalAgent:
     """
     Kariyer planlama ajanı sınıfı.
@@ -76,6 +80,120 @@ class CareerGoalAgent:
         # yanıtın içeriği parse edilip JSON formatında döndürülüyor
         return self.parse_response(response.content)
     
+    def continue_conversation(
+        self,
+        message: str,
+        previous_plan: Optional[dict] = None,
+        summary: str = "",
+        turns: Optional[List[Dict[str, str]]] = None,
+        career_goal: str = ""
+    ) -> dict:
+        """
+        Konuşma bağlamını kullanarak kullanıcı mesajını yanıtlar.
+        
+        Önceki bir plan yoksa `ask_career_plan` ile yeni plan oluşturulur.
+        Varsa model, mesajın yeni bir hedef mi yoksa mevcut plana yönelik bir
+        düzeltme mi ("daha kısa bir plan" gibi) olduğuna karar verir. Düzeltmelerde
+        model yalnızca değişen alanları döndürür ve bunlar önceki planın üzerine
+        uygulanır; böylece tüm plan yeniden üretilmez.
+        
+        Args:
+            message (str): Kullanıcının son mesajı
+            previous_plan (dict, optional): Kullanıcının son kariyer planı
+            summary (str, optional): Eski mesajların özeti
+            turns (List[Dict[str, str]], optional): Son mesajlar
+                ({"role": "user"|"assistant", "content": "..."})
+            career_goal (str, optional): Kullanıcının kayıtlı kariyer hedefi
+            
+        Returns:
+            dict: Sonuç sözlüğü
+                - tür: "yeni" veya "güncelleme"
+                - plan: Güncel kariyer planının tamamı
+                - değişiklikler: Önceki plana göre değişen alanlar
+                
+        Raises:
+            ValueError: AI yanıtı JSON formatında değilse veya iki denemede de
+                        geçerli bir plan (metin listelerinden oluşan alanlar)
+                        içermezse
+        """
+        if not previous_plan:
+            plan = self.ask_career_plan(message)
+            return {"tür": "yeni", "plan": plan, "değişiklikler": plan}
+
+        messages = [
+            SystemMessage(content = (
+                "Sen bir kariyer planlama asistanısın. Kullanıcının mevcut bir kariyer planı var ve seninle sohbet ediyor."
+                "Kullanıcının son mesajı yeni bir kariyer hedefi ise tüm planı yeniden oluştur."
+                "Mesaj mevcut plana yönelik bir düzeltme veya istek ise (ör. daha kısa, daha detaylı, bir beceri ekle) "
+                "*sadece* değişen alanları döndür; değişmeyen alanları yazma."
+                "Sonuçlar *sadece* aşağıdaki JSON formatında olmalıdır:\n"
+                "{\n \"tür\": \"yeni\" veya \"güncelleme\",\n \"değişiklikler\": {\"adımlar\": [\"...\"], \"gerekli_beceriler\": [\"...\"], "
+                "\"önerilen_egitim\": [\"...\"], \"deneyim\": [\"...\"]}\n}\n"
+                f"Mevcut plan: {json.dumps(previous_plan, ensure_ascii=False, separators=(',', ':'))}"
+            ))
+        ]
+        if career_goal:
+            messages.append(SystemMessage(content = f"Kullanıcının mevcut kariyer hedefi: {career_goal}"))
+        if summary:
+            messages.append(SystemMessage(content = f"Önceki konuşmanın özeti:\n{summary}"))
+        for turn in turns or []:
+            if turn["role"] == "user":
+                messages.append(HumanMessage(content = turn["content"]))
+            else:
+                messages.append(AIMessage(content = turn["content"]))
+        messages.append(HumanMessage(content = message))
+
+        # Geçersiz veya eksik bir yanıt gelirse bir kez daha denenir
+        for _ in range(2):
+            response = self.chat_model.invoke(messages)
+            result = self.parse_response(response.content)
+            if not isinstance(result, dict):
+                error = f"Model JSON nesnesi yerine {type(result).__name__} döndürdü."
+                continue
+
+            # Model eski formatta (alanlar en üst seviyede) yanıt verebilir
+            changes = result.get("değişiklikler")
+            if not isinstance(changes, dict):
+                changes = result
+            changes = self.plan_fields(changes)
+
+            # "tür" belirtilmemişse hedef değiştirilmez, yanıt düzeltme sayılır
+            if result.get("tür") != "yeni":
+                if not changes:
+                    error = "Model geçerli bir plan değişikliği döndürmedi."
+                    continue
+                plan = dict(previous_plan)
+                plan.update(changes)
+                return {"tür": "güncelleme", "plan": plan, "değişiklikler": changes}
+            if all(key in changes for key in PLAN_KEYS):
+                return {"tür": "yeni", "plan": changes, "değişiklikler": changes}
+            error = (
+                f"Model eksik bir kariyer planı döndürdü. Eksik alanlar: "
+                f"{', '.join(key for key in PLAN_KEYS if key not in changes)}"
+            )
+
+        raise ValueError(error)
+
+    @staticmethod
+    def plan_fields(data: dict) -> dict:
+        """
+        Sözlükten yalnızca geçerli plan alanlarını seçer.
+        
+        Geçerli alan, PLAN_KEYS içinde olan ve değeri metinlerden oluşan bir
+        liste olan alandır. Tek bir metin gibi başka türdeki değerler
+        atılır; aksi halde arayüz metni harf harf listeler.
+        
+        Args:
+            data (dict): Modelden gelen alanlar
+            
+        Returns:
+            dict: Geçerli plan alanları
+        """
+        return {
+            key: value for key, value in data.items()
+            if key in PLAN_KEYS and isinstance(value, list) and all(isinstance(item, str) for item in value)
+        }
+
     def parse_response(self, response_content: str) -> dict:
         """
         AI modelinden gelen yanıtı JSON formatına dönüştürür.
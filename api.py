@@ -9,7 +9,7 @@ Tarih: 21 Ocak 2026
 Versiyon: 1.0.0
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -18,11 +18,16 @@ import os
 from dotenv import load_dotenv
 import json
 import asyncio
+import time
 
 from agents.career_goal_agent import CareerGoalAgent
 from agents.task_scheduler_agent import TaskSchedulerAgent
 from tools.suggestion_tool import SuggestionTool
-from memory.user_memory import UserMemory
+from tools.resource_enricher import ResourceEnricher
+from memory.memory_store import MemoryStore, RetentionSweeper
+from memory.conversation import ConversationHistory
+from memory.shared_cache import get_shared_cache
+from memory.worker_metrics import WorkerMetrics
 
 # Çevre değişkenlerini yükle
 load_dotenv()
@@ -64,11 +69,71 @@ class ChatResponse(BaseModel):
 
 
 # Global değişkenler
+#
+# Süreç modeli: Her worker (uvicorn --workers N veya gunicorn -k
+# uvicorn.workers.UvicornWorker) bu modülü kendisi import eder. HTTP bağlantı
+# havuzu, Gemini istemcisi ve SQLite bağlantısı gibi süreçler arasında
+# paylaşılamayan nesneler modül yüklenirken değil, her worker'ın startup
+# olayında oluşturulur; böylece `gunicorn --preload` ile fork edilse bile
+# ebeveyn süreçten miras alınmazlar. Worker'lar arası paylaşılan durum
+# yalnızca kullanıcı belleği deposu (dosya kilidiyle) ve paylaşılan
+# önbellektir (SHARED_CACHE_URL).
 api_key = os.getenv("GOOGLE_GEMINI_API_KEY")
 goal_agent = None
+resource_enricher = None
+worker_metrics = None
+retention_sweeper = None
 
-if api_key:
-    goal_agent = CareerGoalAgent(api_key=api_key)
+# Kullanıcı belleği deposu (MEMORY_DIR) - yalnızca dizin yolu tutar, fork güvenlidir
+memory_store = MemoryStore()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Worker başlarken süreç içi nesneleri oluşturur."""
+    global goal_agent, resource_enricher, worker_metrics, retention_sweeper
+    if api_key:
+        goal_agent = CareerGoalAgent(api_key=api_key)
+    shared_cache = get_shared_cache()
+    # Kaynak zenginleştirici - HTTP bağlantı havuzu worker içindeki istekler arasında paylaşılır
+    resource_enricher = ResourceEnricher()
+    worker_metrics = WorkerMetrics(shared_cache)
+    # MEMORY_RETENTION_DAYS ayarlıysa pasif kullanıcılar arka planda silinir.
+    # Her worker bir temizleyici başlatır, ancak depo düzeyindeki kilidi yalnızca
+    # biri alabildiği için temizliği tek bir süreç yapar.
+    retention_days = os.getenv("MEMORY_RETENTION_DAYS")
+    if retention_days:
+        retention_sweeper = RetentionSweeper(memory_store, float(retention_days) * 86400)
+        retention_sweeper.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Worker kapanırken HTTP bağlantı havuzunu kapatır, metrikleri yazar ve temizleyiciyi durdurur."""
+    if resource_enricher is not None:
+        await resource_enricher.aclose()
+    if worker_metrics is not None:
+        worker_metrics.flush()
+    if retention_sweeper is not None:
+        retention_sweeper.stop()
+
+
+@app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    """Her isteğin süresini worker metriklerine kaydeder."""
+    start = time.perf_counter()
+    response = await call_next(request)
+    if worker_metrics is not None:
+        # Eşleşmeyen yollar ayrı metrik anahtarı üretmesin diye route şablonu kullanılır
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        if worker_metrics.observe(path, time.perf_counter() - start):
+            # Paylaşılan önbelleğe yazma event loop'u bloklamasın
+            try:
+                await asyncio.to_thread(worker_metrics.flush, worker_metrics.drain())
+            except Exception as e:
+                print(f"⚠ Metrikler yazılamadı: {str(e)}")
+    return response
 
 
 @app.get("/")
@@ -81,6 +146,12 @@ async def root():
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Tüm worker'ların birleştirilmiş istek metrikleri"""
+    return await asyncio.to_thread(worker_metrics.aggregate, worker_metrics.drain())
+
+
 @app.get("/health")
 async def health_check():
     """Sağlık kontrolü endpoint'i"""
@@ -128,20 +199,40 @@ async def chat_stream(request: ChatRequest):
             status_code=500,
             detail="API anahtarı yapılandırılmamış. Lütfen GOOGLE_GEMINI_API_KEY ayarlayın."
         )
+    try:
+        memory_store.check_user_id(request.user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     try:
         # Kullanıcı mesajından kariyer hedefini çıkar
         message = request.message.strip()
         
+        # Bellek dosyası kilit altında okunur; event loop'u bloklamasın
+        user_memory = await asyncio.to_thread(memory_store.open, request.user_id)
+        conversation = ConversationHistory(user_memory)
+        updates = {}
+        
         # Basit bir komut analizi
         if any(keyword in message.lower() for keyword in ['merhaba', 'selam', 'hey', 'hello']):
             response_text = "👋 Merhaba! Ben Kariyer Gelişim Ajanı.\n\n✨ Size kariyer hedeflerinizde yardımcı olabilirim. Kariyer hedefinizi benimle paylaşır mısınız?"
+            history_text = response_text
         else:
-            # Kariyer planı oluştur
-            career_plan = goal_agent.ask_career_plan(message)
+            # Konuşma bağlamıyla kariyer planı oluştur veya güncelle
+            summary, turns = conversation.window()
+            result = goal_agent.continue_conversation(
+                message, user_memory.get_memory("last_career_plan"), summary, turns,
+                career_goal=user_memory.get_memory("career_goal") or ""
+            )
+            career_plan = result["plan"]
             
             # Yanıtı formatla
-            response_text = f"🎯 Harika! '{message}' hedefi için size detaylı bir kariyer planı hazırladım!\n\n"
+            if result["tür"] == "güncelleme":
+                history_text = f"Planı güncelledim: {', '.join(result['değişiklikler']) or 'değişiklik yok'}."
+                response_text = "🔄 Tamam! Planınızı isteğinize göre güncelledim.\n\n"
+            else:
+                history_text = f"'{message}' hedefi için yeni bir kariyer planı hazırladım."
+                response_text = f"🎯 Harika! '{message}' hedefi için size detaylı bir kariyer planı hazırladım!\n\n"
             response_text += "═" * 50 + "\n\n"
             
             if "adımlar" in career_plan:
@@ -168,10 +259,12 @@ async def chat_stream(request: ChatRequest):
             response_text += "═" * 50 + "\n\n"
             response_text += "💼 Başarılar dilerim! Herhangi bir sorunuz varsa sormaktan çekinmeyin."
             
-            # Kullanıcı belleğine kaydet
-            user_memory = UserMemory(f"memory_{request.user_id}.json")
-            user_memory.update_goal(message)
-            user_memory.update_memory("last_career_plan", career_plan)
+            # Kullanıcı belleğine konuşmayla birlikte tek işlemde kaydedilir
+            if result["tür"] == "yeni":
+                updates["career_goal"] = message
+            updates["last_career_plan"] = career_plan
+        
+        await asyncio.to_thread(conversation.add_exchange, message, history_text, updates)
         
         # Stream yanıt döndür
         return StreamingResponse(
@@ -199,21 +292,34 @@ async def chat(request: ChatRequest):
             status_code=500,
             detail="API anahtarı yapılandırılmamış. Lütfen GOOGLE_GEMINI_API_KEY ayarlayın."
         )
+    try:
+        memory_store.check_user_id(request.user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     try:
         message = request.message.strip()
-        user_memory = UserMemory(f"memory_{request.user_id}.json")
+        # Bellek dosyası kilit altında okunur/yazılır; event loop'u bloklamasın
+        user_memory = await asyncio.to_thread(memory_store.open, request.user_id)
+        conversation = ConversationHistory(user_memory)
         
         # Selamlaşma kontrolü
         if any(keyword in message.lower() for keyword in ['merhaba', 'selam', 'hey', 'hello']):
-            return ChatResponse(
-                response="Merhaba! Ben Kariyer Gelişim Ajanı. Size kariyer hedeflerinizde yardımcı olabilirim. Kariyer hedefinizi benimle paylaşır mısınız?"
-            )
+            response_text = "Merhaba! Ben Kariyer Gelişim Ajanı. Size kariyer hedeflerinizde yardımcı olabilirim. Kariyer hedefinizi benimle paylaşır mısınız?"
+            await asyncio.to_thread(conversation.add_exchange, message, response_text)
+            return ChatResponse(response=response_text)
         
-        # Kariyer planı oluştur
-        career_plan = goal_agent.ask_career_plan(message)
-        user_memory.update_goal(message)
-        user_memory.update_memory("last_career_plan", career_plan)
+        # Konuşma bağlamıyla kariyer planı oluştur veya güncelle
+        summary, turns = conversation.window()
+        result = goal_agent.continue_conversation(
+            message, user_memory.get_memory("last_career_plan"), summary, turns,
+            career_goal=user_memory.get_memory("career_goal") or ""
+        )
+        career_plan = result["plan"]
+        updates = {"last_career_plan": career_plan}
+        if result["tür"] == "yeni":
+            updates["career_goal"] = message
+        goal = updates.get("career_goal") or user_memory.get_memory("career_goal") or message
         
         # Görev planı oluştur
         task_agent = TaskSchedulerAgent(weeks=4)
@@ -224,11 +330,17 @@ async def chat(request: ChatRequest):
         
         # Kaynakları ara
         suggestion_tool = SuggestionTool()
-        resources = suggestion_tool.search_resources(f"{message} için kaynaklar", max_results=5)
+        resources = suggestion_tool.search_resources(f"{goal} için kaynaklar", max_results=5)
+        resources = await resource_enricher.enrich(resources)
         
         # Yanıtı formatla
-        response_text = f"Harika! '{message}' hedefi için detaylı bir kariyer planı hazırladım. "
+        if result["tür"] == "güncelleme":
+            response_text = f"Tamam! '{goal}' hedefi için planınızı isteğinize göre güncelledim. "
+        else:
+            response_text = f"Harika! '{message}' hedefi için detaylı bir kariyer planı hazırladım. "
         response_text += "Aşağıda adımları, becerileri ve önerilen eğitimleri bulabilirsiniz."
+        # Hedef, plan ve konuşma tek kilit ve tek dosya yazımıyla kaydedilir
+        await asyncio.to_thread(conversation.add_exchange, message, response_text, updates)
         
         return ChatResponse(
             response=response_text,
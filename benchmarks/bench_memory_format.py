@@ -0,0 +1,98 @@
+"""
+Bellek Formatı Karşılaştırma Betiği
+
+Bu betik, kullanıcı belleği için desteklenen serileştiricileri sentetik
+kariyer planları üzerinde karşılaştırır. Her format için kullanıcı başına
+diskteki bayt miktarı ile ortalama kaydetme ve yükleme süreleri raporlanır.
+
+Kullanım:
+    $ python -m benchmarks.bench_memory_format --users 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory.serializers import SERIALIZERS, get_serializer
+from memory.user_memory import UserMemory
+
+
+GOALS = ["Veri Bilimci", "Yazılım Mühendisi", "Yapay Zeka Uzmanı", "DevOps Mühendisi", "Ürün Yöneticisi"]
+
+
+def make_plan(goal: str, rng: random.Random) -> dict:
+    """
+    Gerçek yanıtlara benzeyen sentetik bir kariyer planı üretir.
+
+    Args:
+        goal (str): Kariyer hedefi
+        rng (random.Random): Rastgele sayı üreteci
+
+    Returns:
+        dict: Kariyer planı sözlüğü
+    """
+    return {
+        "adımlar": [f"{goal} için temel programlama becerilerini öğrenin ({i}. adım)" for i in range(rng.randint(5, 10))],
+        "gerekli_beceriler": ["Python", "SQL", "İletişim becerileri", "Problem çözme", "Takım çalışması"],
+        "önerilen_egitim": [f"{goal} sertifika programı", "Online kurslar", "Üniversite lisans derecesi"],
+        "deneyim": [f"{rng.randint(1, 5)} yıl deneyim", "Staj veya gönüllü projelerde deneyim kazanın"],
+    }
+
+
+def run(format_name: str, users: int, workdir: str) -> None:
+    """
+    Tek bir format için kaydetme/yükleme ölçümü yapar ve sonucu yazdırır.
+
+    Args:
+        format_name (str): Serileştirici adı
+        users (int): Sentetik kullanıcı sayısı
+        workdir (str): Dosyaların yazılacağı dizin
+    """
+    rng = random.Random(42)
+    serializer = get_serializer(format_name)
+    # Constructor'daki boş dosya yazımı kaydetme süresine girmesin
+    memories = [
+        UserMemory(os.path.join(workdir, f"memory_{format_name}_{i}.json"), serializer=serializer)
+        for i in range(users)
+    ]
+    for memory in memories:
+        goal = rng.choice(GOALS)
+        memory.memory["career_goal"] = goal
+        memory.memory["last_career_plan"] = make_plan(goal, rng)
+    paths = [memory.file_path for memory in memories]
+
+    start = time.perf_counter()
+    for memory in memories:
+        memory.save_memory()
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for path in paths:
+        UserMemory(path, serializer=serializer)
+    load_time = time.perf_counter() - start
+
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    print(
+        f"{format_name:<16} ({serializer.backend:<13}) {total_bytes / users:>10.0f} B/kullanıcı "
+        f"{save_time / users * 1e6:>10.1f} µs kaydet "
+        f"{load_time / users * 1e6:>10.1f} µs yükle"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bellek formatı karşılaştırması")
+    parser.add_argument("--users", type=int, default=500, help="Sentetik kullanıcı sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for format_name in SERIALIZERS:
+            run(format_name, args.users, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Bellek Deposu Karşılaştırma Betiği
+
+Bu betik, sentetik bir kullanıcı veri kümesi üzerinde bellek deposunun
+toplu içe aktarma, akış halinde dışa aktarma, sayma ve saklama temizliği
+hızını ölçer. Kullanıcıların yarısının son erişimi 100 gün öncesine
+ayarlanır, temizleyici 90 günden eski olanları siler.
+
+Kullanım:
+    $ python benchmarks/bench_memory_store.py --users 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory.memory_store import MemoryStore
+
+
+def synthetic_jsonl(path: str, users: int) -> None:
+    """
+    Sentetik kullanıcılardan oluşan bir JSONL dosyası yazar.
+
+    Args:
+        path (str): Çıktı dosyası
+        users (int): Kullanıcı sayısı
+    """
+    now = time.time()
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(users):
+            record = {
+                "user_id": f"user_{i}",
+                "last_access": now - (100 if i % 2 else 1) * 86400,
+                "memory": {
+                    "career_goal": "Veri Bilimci",
+                    "last_career_plan": {"adımlar": ["Python öğrenin", "Proje geliştirin"], "deneyim": ["2 yıl"]},
+                },
+            }
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def timed(label: str, users: int, func):
+    """
+    Bir işlemi çalıştırıp süresini ve saniyedeki kullanıcı sayısını yazdırır.
+
+    Args:
+        label (str): İşlemin adı
+        users (int): İşlenen kullanıcı sayısı (hız hesabı için)
+        func (callable): Çalıştırılacak işlem
+
+    Returns:
+        Any: İşlemin dönüş değeri
+    """
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:>8.2f} sn  {users / elapsed:>10.0f} kullanıcı/sn  sonuç={result}")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bellek deposu karşılaştırması")
+    parser.add_argument("--users", type=int, default=100000, help="Sentetik kullanıcı sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "users.jsonl")
+        synthetic_jsonl(source, args.users)
+        store = MemoryStore(os.path.join(workdir, "store"))
+
+        with open(source, "r", encoding="utf-8") as f:
+            timed("import", args.users, lambda: store.import_jsonl(f))
+        timed("count", args.users, store.count)
+        with open(os.devnull, "w", encoding="utf-8") as out:
+            timed("export", args.users, lambda: store.export_jsonl(out))
+        timed("open", 1000, lambda: len([store.open(f"user_{i}") for i in range(1000)]))
+        timed("sweep", args.users, lambda: store.sweep(90 * 86400))
+        timed("count", args.users, store.count)
+
+
+if __name__ == "__main__":
+    main()
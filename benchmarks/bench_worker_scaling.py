@@ -0,0 +1,99 @@
+"""
+Worker Ölçeklenme Karşılaştırma Betiği
+
+Bu betik, `/chat` isteğinin model çağrısı dışındaki adımlarının (kullanıcı
+belleği okuma/yazma, konuşma geçmişi, kaynak tekilleştirme ve paylaşılan
+önbellek okuması) worker sayısı arttıkça nasıl ölçeklendiğini ölçer. Her
+worker ayrı bir süreçte, kendi kullanıcı kümesi üzerinde çalışır ve aynı
+paylaşılan önbelleği kullanır.
+
+Kullanım:
+    $ python benchmarks/bench_worker_scaling.py --ops 2000
+
+Not: Doğrusal ölçeklenme yalnızca çok çekirdekli bir makinede görülebilir;
+betik, çekirdek sayısı worker sayısından azsa uyarı yazdırır.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory.conversation import ConversationHistory
+from memory.shared_cache import SQLiteCache
+from memory.user_memory import UserMemory
+from tools.resource_enricher import PageMetadataCache, ResourceEnricher
+
+
+RESULTS = [
+    {"title": "Python Kursu", "href": "https://www.example.com/python/?utm_source=ddg"},
+    {"title": "Python Kursu", "href": "http://example.com/python"},
+    {"title": "Veri Bilimi", "href": "https://example.org/veri-bilimi#giris"},
+]
+
+
+def warm_up(_: int) -> int:
+    """Havuzdaki süreçlerin başlamasını bekler."""
+    return os.getpid()
+
+
+def worker(args) -> int:
+    """
+    Tek bir worker sürecinde sabit sayıda işlem yapar.
+
+    Args:
+        args (tuple): (worker_no, işlem sayısı, çalışma dizini, önbellek yolu)
+
+    Returns:
+        int: Tamamlanan işlem sayısı
+    """
+    worker_no, ops, workdir, cache_path = args
+    page_cache = PageMetadataCache(SQLiteCache(cache_path))
+    for i in range(ops):
+        memory = UserMemory(os.path.join(workdir, f"memory_w{worker_no}_{i % 50}.json"))
+        ConversationHistory(memory).add_exchange(
+            "daha kısa bir plan", "Planı güncelledim: adımlar.",
+            {"last_career_plan": {"adımlar": ["Python öğrenin", "Proje geliştirin"]}}
+        )
+        for result in ResourceEnricher.dedupe(RESULTS):
+            page_cache.get(result["href"])
+    return ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worker ölçeklenme karşılaştırması")
+    parser.add_argument("--ops", type=int, default=2000, help="Worker başına işlem sayısı")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    if args.max_workers > cores:
+        print(f"⚠ Bu makinede {cores} çekirdek var; {cores} worker'dan sonrası ölçeklenmeyi göstermez.")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cache_path = os.path.join(workdir, "shared_cache.sqlite3")
+        page_cache = PageMetadataCache(SQLiteCache(cache_path))
+        for result in RESULTS:
+            page_cache.set(result["href"], {"title": result["title"], "description": "", "reachable": True})
+
+        baseline = None
+        workers = 1
+        while workers <= args.max_workers:
+            jobs = [(w, args.ops, workdir, cache_path) for w in range(workers)]
+            with multiprocessing.Pool(workers) as pool:
+                # Süreç başlatma maliyeti ölçüme girmesin
+                pool.map(warm_up, range(workers))
+                start = time.perf_counter()
+                total = sum(pool.map(worker, jobs, chunksize=1))
+                throughput = total / (time.perf_counter() - start)
+            baseline = baseline or throughput
+            print(f"{workers:>3} worker  {throughput:>10.0f} işlem/sn  hızlanma x{throughput / baseline:.2f}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Konuşma Geçmişi Modülü
+
+Bu modül, kullanıcı başına konuşma geçmişini `UserMemory` içinde saklar ve
+modele gönderilecek bağlamı bir token bütçesiyle sınırlar. Son mesajlar
+olduğu gibi tutulur; bütçeyi aşan eski mesajlar kısaltılarak sürekli
+güncellenen bir özete katlanır. Böylece konuşma ne kadar uzarsa uzasın hem
+diskteki kayıt hem de istem (prompt) boyutu sabit kalır.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from memory.user_memory import UserMemory
+
+
+HISTORY_KEY = "conversation_history"
+SUMMARY_KEY = "conversation_summary"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Metnin yaklaşık token sayısını hesaplar.
+
+    Gemini tokenizer'ı çağırmak bir ağ isteği gerektirdiğinden, ortalama
+    4 karakter = 1 token yaklaşımı kullanılır.
+
+    Args:
+        text (str): Token sayısı tahmin edilecek metin
+
+    Returns:
+        int: Yaklaşık token sayısı
+    """
+    return len(text) // 4 + 1
+
+
+class ConversationHistory:
+    """
+    Token bütçeli konuşma geçmişi sınıfı.
+
+    Attributes:
+        user_memory (UserMemory): Geçmişin saklandığı kullanıcı belleği
+        recent_token_budget (int): Olduğu gibi tutulan son mesajların bütçesi
+        summary_token_budget (int): Eski mesajların özetinin bütçesi
+        summary_line_chars (int): Özete katlanan her mesajın en fazla uzunluğu
+    """
+
+    def __init__(
+        self,
+        user_memory: UserMemory,
+        recent_token_budget: int = 800,
+        summary_token_budget: int = 300,
+        summary_line_chars: int = 160
+    ):
+        """
+        ConversationHistory sınıfının constructor fonksiyonu.
+
+        Args:
+            user_memory (UserMemory): Kullanıcı belleği
+            recent_token_budget (int, optional): Son mesajlar için token bütçesi.
+                                                 Varsayılan değer 800
+            summary_token_budget (int, optional): Özet için token bütçesi.
+                                                  Varsayılan değer 300
+            summary_line_chars (int, optional): Özet satırı karakter sınırı.
+                                                Varsayılan değer 160
+        """
+        self.user_memory = user_memory
+        self.recent_token_budget = recent_token_budget
+        self.summary_token_budget = summary_token_budget
+        self.summary_line_chars = summary_line_chars
+
+    def get_turns(self) -> List[Dict[str, str]]:
+        """
+        Olduğu gibi tutulan son mesajları döndürür.
+
+        Returns:
+            List[Dict[str, str]]: {"role": "user"|"assistant", "content": "..."} listesi
+        """
+        return list(self.user_memory.get_memory(HISTORY_KEY) or [])
+
+    def get_summary(self) -> str:
+        """
+        Eski mesajların özetini döndürür.
+
+        Returns:
+            str: Özet metni. Özet yoksa boş metin döner.
+        """
+        return self.user_memory.get_memory(SUMMARY_KEY) or ""
+
+    def add_turn(self, role: str, content: str) -> None:
+        """
+        Geçmişe yeni bir mesaj ekler ve bütçeyi aşan eski mesajları özete katlar.
+
+        Args:
+            role (str): Mesajın sahibi ("user" veya "assistant")
+            content (str): Mesaj metni
+        """
+        with self.user_memory.transaction() as memory:
+            self._append(memory, role, content)
+
+    def add_exchange(self, user_message: str, assistant_message: str, updates: Optional[dict] = None) -> None:
+        """
+        Bir kullanıcı mesajını ve asistan yanıtını birlikte ekler.
+
+        İki mesaj ve verilen diğer bellek güncellemeleri (ör. son kariyer
+        planı) tek bir kilit ve tek bir dosya yazımıyla kaydedilir.
+
+        Args:
+            user_message (str): Kullanıcının mesajı
+            assistant_message (str): Asistanın yanıtı
+            updates (dict, optional): Aynı işlemde yazılacak diğer anahtarlar
+        """
+        with self.user_memory.transaction() as memory:
+            memory.update(updates or {})
+            self._append(memory, "user", user_message)
+            self._append(memory, "assistant", assistant_message)
+
+    def window(self) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Modele gönderilecek bağlam penceresini döndürür.
+
+        Returns:
+            Tuple[str, List[Dict[str, str]]]: (özet, son mesajlar)
+        """
+        return self.get_summary(), self.get_turns()
+
+    def _append(self, memory: dict, role: str, content: str) -> None:
+        """
+        Bellek sözlüğüne bir mesaj ekler ve bütçeyi aşan eski mesajları özete katlar.
+
+        Args:
+            memory (dict): Kilit altında açılmış bellek sözlüğü
+            role (str): Mesajın sahibi ("user" veya "assistant")
+            content (str): Mesaj metni
+        """
+        turns = list(memory.get(HISTORY_KEY) or [])
+        turns.append({"role": role, "content": content})
+        summary = memory.get(SUMMARY_KEY) or ""
+
+        while len(turns) > 1 and sum(estimate_tokens(t["content"]) for t in turns) > self.recent_token_budget:
+            summary = self._fold(summary, turns.pop(0))
+
+        memory[HISTORY_KEY] = turns
+        memory[SUMMARY_KEY] = summary
+
+    def _fold(self, summary: str, turn: Dict[str, str]) -> str:
+        """
+        Bir mesajı kısaltarak özete ekler ve özeti bütçe içinde tutar.
+
+        Özet bütçeyi aşarsa en eski satırlar atılır.
+
+        Args:
+            summary (str): Mevcut özet
+            turn (Dict[str, str]): Özete katlanacak mesaj
+
+        Returns:
+            str: Güncellenmiş özet
+        """
+        speaker = "Kullanıcı" if turn["role"] == "user" else "Asistan"
+        content = " ".join(turn["content"].split())
+        if len(content) > self.summary_line_chars:
+            content = content[:self.summary_line_chars - 1] + "…"
+
+        lines = summary.splitlines() if summary else []
+        lines.append(f"- {speaker}: {content}")
+        while len(lines) > 1 and estimate_tokens("\n".join(lines)) > self.summary_token_budget:
+            lines.pop(0)
+        return "\n".join(lines)
@@ -0,0 +1,580 @@
+"""
+Bellek Deposu Modülü
+
+Bu modül, tüm kullanıcıların `UserMemory` dosyalarını parçalı (sharded) bir
+dizin yapısında yönetir ve yönetici işlemleri sağlar:
+
+    - Akış halinde (sabit bellekle) JSONL dışa aktarma
+    - Partiler halinde yazan toplu içe aktarma
+    - Son erişim zamanına göre pasif kullanıcıları silen saklama temizleyicisi
+    - Çalışma dizinindeki eski dosyaları toplu olarak depoya taşıma
+
+Dizin yapısı: {kök}/{sha1[0:2]}/{sha1[2:4]}/{kullanıcı_id}{uzantı}
+
+65.536 alt dizine dağıtıldığı için 1 milyon kullanıcıda bile her dizinde
+birkaç düzine dosya bulunur. Her parça dizininin kendi kilit dosyası vardır;
+aynı parçadaki kullanıcıların yazmaları bu kilitle sıralanır.
+
+Son erişim zamanı olarak dosyanın değiştirilme zamanı (mtime) kullanılır;
+`open` her çağrıldığında dosyaya parça kilidi altında dokunulur.
+
+Çalışma dizininde kalmış eski `memory_{user_id}.*` dosyaları `migrate` ile
+toplu olarak depoya taşınır; arka plan temizleyicisi de her turda önce bu
+taşımayı yapar.
+
+Kullanım:
+    $ python -m memory.memory_store export yedek.jsonl
+    $ python -m memory.memory_store import yedek.jsonl
+    $ python -m memory.memory_store sweep --days 90
+    $ python -m memory.memory_store migrate
+    $ python -m memory.memory_store count
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from typing import IO, Iterator, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from memory.serializers import Serializer, get_serializer, known_extensions, serializer_for_extension
+from memory.user_memory import UserMemory, file_lock
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows'ta dosya kilidi yoktur
+    fcntl = None
+
+
+LOCK_NAME = ".lock"
+SWEEPER_LOCK_NAME = ".sweeper.lock"
+LEGACY_PREFIX = "memory_"
+# Dosya adı sınırı (çoğu dosya sisteminde 255 bayt); uzantı ve geçici dosya
+# soneki (".{pid}.tmp") için pay bırakılır.
+MAX_NAME_LENGTH = 200
+
+
+class MemoryStore:
+    """
+    Parçalı dizin yapısında kullanıcı belleği deposu.
+
+    Attributes:
+        root (str): Deponun kök dizini
+        legacy_dir (str): Eski `memory_{user_id}.*` dosyalarının bulunduğu dizin
+        serializer (Serializer): Bellek dosyalarının formatı
+    """
+
+    def __init__(self, root: Optional[str] = None, legacy_dir: str = ".",
+                 serializer: Optional[Serializer] = None):
+        """
+        Args:
+            root (str, optional): Kök dizin. Verilmezse MEMORY_DIR çevre
+                                  değişkeni, o da yoksa "memory_store"
+            legacy_dir (str, optional): Eski bellek dosyalarının dizini.
+                                        Varsayılan çalışma dizini
+            serializer (Serializer, optional): Dosya formatı. Varsayılan get_serializer()
+        """
+        self.root = root or os.getenv("MEMORY_DIR", "memory_store")
+        self.legacy_dir = legacy_dir
+        self.serializer = serializer or get_serializer()
+        os.makedirs(self.root, exist_ok=True)
+
+    def _shard_dir(self, user_id: str) -> str:
+        digest = hashlib.sha1(user_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest[2:4])
+
+    @staticmethod
+    def _file_name(user_id: str) -> str:
+        """
+        Kullanıcı kimliğini uzantısız dosya adına dönüştürür.
+
+        Kimlik URL kodlanır, böylece "/" veya ".." içeren kimlikler depo
+        dışına yazamaz. Yalnızca noktalardan oluşan kimliklerde noktalar da
+        kodlanır; aksi halde uzantı ayrıştırılamaz ve dosya depoda görünmez.
+
+        Args:
+            user_id (str): Kullanıcı kimliği
+
+        Returns:
+            str: Dosya adı (uzantısız)
+
+        Raises:
+            ValueError: Kimlik boşsa veya dosya adı olamayacak kadar uzunsa
+        """
+        if not user_id:
+            raise ValueError("Kullanıcı kimliği boş olamaz.")
+        name = quote(user_id, safe="")
+        if not name.strip("."):
+            name = name.replace(".", "%2E")
+        if len(name) > MAX_NAME_LENGTH:
+            raise ValueError(
+                f"Kullanıcı kimliği çok uzun (kodlanmış hali en fazla {MAX_NAME_LENGTH} karakter olabilir)."
+            )
+        return name
+
+    def check_user_id(self, user_id: str) -> None:
+        """
+        Kullanıcı kimliğinin depoda saklanabilir olduğunu doğrular.
+
+        Args:
+            user_id (str): Kullanıcı kimliği
+
+        Raises:
+            ValueError: Kimlik boşsa veya çok uzunsa
+        """
+        self._file_name(user_id)
+
+    def path_for(self, user_id: str) -> str:
+        """
+        Kullanıcının bellek dosyasının yolunu döndürür.
+
+        Args:
+            user_id (str): Kullanıcı kimliği
+
+        Returns:
+            str: Bellek dosyasının yolu
+
+        Raises:
+            ValueError: Kimlik boşsa veya çok uzunsa
+        """
+        return os.path.join(self._shard_dir(user_id), self._file_name(user_id) + self.serializer.extension)
+
+    def _extensions(self) -> list:
+        """Kayıtlı uzantılar; geçerli formatınki ilk sırada."""
+        return [self.serializer.extension] + [
+            extension for extension in known_extensions() if extension != self.serializer.extension
+        ]
+
+    def _user_files(self, user_id: str) -> list:
+        """
+        Kullanıcının depodaki tüm formatlardaki dosyalarını döndürür.
+
+        İlk eleman, `open` ve `export_jsonl`'ın geçerli saydığı dosyadır
+        (geçerli format varsa o, yoksa kayıtlı formatlardan ilki).
+
+        Args:
+            user_id (str): Kullanıcı kimliği
+
+        Returns:
+            list: Var olan dosya yolları
+        """
+        root = os.path.join(self._shard_dir(user_id), self._file_name(user_id))
+        return [root + extension for extension in self._extensions() if os.path.exists(root + extension)]
+
+    def _consolidate(self, user_id: str) -> bool:
+        """
+        Kullanıcının depoda tek bir dosyası kalmasını sağlar.
+
+        Geçerli dosya başka bir formattaysa geçerli formata taşınır; diğer
+        formatlardaki kopyalar silinir. Parça kilidi altında çağrılmalıdır.
+
+        Args:
+            user_id (str): Kullanıcı kimliği
+
+        Returns:
+            bool: Kullanıcının depoda bir dosyası varsa True
+        """
+        files = self._user_files(user_id)
+        if not files:
+            return False
+        if files[0] != self.path_for(user_id):
+            self._write({
+                "user_id": user_id,
+                "last_access": os.path.getmtime(files[0]),
+                "memory": self._read(files[0]),
+            })
+        else:
+            for path in files[1:]:
+                os.remove(path)
+        return True
+
+    def _lock_path(self, shard_dir: str) -> str:
+        os.makedirs(shard_dir, exist_ok=True)
+        return os.path.join(shard_dir, LOCK_NAME)
+
+    def _legacy_path(self, user_id: str) -> Optional[str]:
+        if os.sep in user_id or (os.altsep and os.altsep in user_id) or user_id in (".", ".."):
+            return None
+        for extension in (self.serializer.extension, ".json"):
+            path = os.path.join(self.legacy_dir, f"memory_{user_id}{extension}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def open(self, user_id: str) -> UserMemory:
+        """
+        Kullanıcının belleğini açar ve son erişim zamanını günceller.
+
+        Eski düzendeki `memory_{user_id}.json` veya `.mpkz` dosyası varsa
+        depoya taşınır.
+
+        Args:
+            user_id (str): Kullanıcı kimliği
+
+        Returns:
+            UserMemory: Kullanıcı belleği
+
+        Raises:
+            ValueError: Kimlik boşsa veya çok uzunsa
+        """
+        path = self.path_for(user_id)
+        return UserMemory(
+            path,
+            serializer=self.serializer,
+            legacy_path=None if os.path.exists(path) else self._legacy_path(user_id),
+            lock_path=self._lock_path(os.path.dirname(path)),
+            touch=True,
+        )
+
+    def _iter_files(self) -> Iterator[Tuple[str, str]]:
+        """
+        Depodaki kullanıcıları ve geçerli dosyalarını parça parça gezer.
+
+        Kayıtlı tüm formatlardaki dosyalar dikkate alınır (MEMORY_FORMAT
+        değiştirildikten sonra henüz açılmamış kullanıcılar da dahil olsun
+        diye). Bir kullanıcının birden fazla formatta dosyası varsa yalnızca
+        `open`'ın kullanacağı dosya döndürülür, böylece her kullanıcı bir kez
+        sayılır.
+
+        Yields:
+            Tuple[str, str]: (kullanıcı kimliği, dosya yolu)
+        """
+        rank = {extension: i for i, extension in enumerate(self._extensions())}
+        for first in sorted(os.listdir(self.root)):
+            first_dir = os.path.join(self.root, first)
+            if not os.path.isdir(first_dir):
+                continue
+            for second in sorted(os.listdir(first_dir)):
+                shard_dir = os.path.join(first_dir, second)
+                files = {}
+                with os.scandir(shard_dir) as entries:
+                    for entry in entries:
+                        name, extension = os.path.splitext(entry.name)
+                        if extension in rank:
+                            files.setdefault(unquote(name), []).append((rank[extension], entry.path))
+                for user_id, paths in files.items():
+                    yield user_id, min(paths)[1]
+
+    def _read(self, path: str) -> dict:
+        """Dosyayı uzantısına uygun serileştiriciyle okur."""
+        serializer = serializer_for_extension(os.path.splitext(path)[1])
+        with open(path, "rb") as f:
+            return serializer.loads(f.read())
+
+    def iter_user_ids(self) -> Iterator[str]:
+        """
+        Depodaki kullanıcı kimliklerini döndürür.
+
+        Yields:
+            str: Kullanıcı kimliği
+        """
+        for user_id, _ in self._iter_files():
+            yield user_id
+
+    def count(self) -> int:
+        """
+        Depodaki kullanıcı sayısını döndürür.
+
+        Returns:
+            int: Kullanıcı sayısı
+        """
+        return sum(1 for _ in self._iter_files())
+
+    def export_jsonl(self, out: IO[str]) -> int:
+        """
+        Tüm kullanıcıları JSONL formatında akış halinde dışa aktarır.
+
+        Her satır bir kullanıcıdır; aynı anda yalnızca bir kullanıcının verisi
+        bellekte tutulur.
+
+        Satır formatı:
+            {"user_id": "...", "last_access": 1737450000.0, "memory": {...}}
+
+        Args:
+            out (IO[str]): Yazılacak metin akışı
+
+        Returns:
+            int: Dışa aktarılan kullanıcı sayısı
+        """
+        exported = 0
+        for user_id, path in self._iter_files():
+            try:
+                last_access = os.path.getmtime(path)
+                memory = self._read(path)
+            except FileNotFoundError:
+                # Dışa aktarma sırasında temizleyici tarafından silinmiş
+                continue
+            record = {"user_id": user_id, "last_access": last_access, "memory": memory}
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            exported += 1
+        return exported
+
+    def import_jsonl(self, source: IO[str], batch_size: int = 1000) -> int:
+        """
+        JSONL akışındaki kullanıcıları partiler halinde içe aktarır.
+
+        Her partideki kayıtlar parça dizinine göre gruplanır ve her parçanın
+        kilidi parti başına bir kez alınır. Aynı kimliğe sahip mevcut
+        kullanıcıların verisi değiştirilir; "last_access" varsa dosyanın
+        son erişim zamanı olarak korunur.
+
+        Args:
+            source (IO[str]): Okunacak metin akışı (export_jsonl çıktısı)
+            batch_size (int, optional): Parti büyüklüğü. Varsayılan 1000
+
+        Returns:
+            int: İçe aktarılan kullanıcı sayısı
+
+        Raises:
+            ValueError: Bir kayıttaki kullanıcı kimliği depoda saklanamıyorsa
+        """
+        imported = 0
+        records = (json.loads(line) for line in source if line.strip())
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                return imported
+            by_shard = {}
+            for record in batch:
+                # Geçersiz bir kimlik partinin yarısı yazıldıktan sonra fark edilmesin
+                self.check_user_id(record["user_id"])
+                by_shard.setdefault(self._shard_dir(record["user_id"]), []).append(record)
+            for shard_dir, shard_records in by_shard.items():
+                with file_lock(self._lock_path(shard_dir)):
+                    for record in shard_records:
+                        self._write(record)
+            imported += len(batch)
+
+    def _write(self, record: dict) -> None:
+        """
+        Kaydı geçerli formatta yazar ve diğer formatlardaki kopyaları siler.
+
+        Parça kilidi altında çağrılmalıdır.
+
+        Args:
+            record (dict): export_jsonl satır formatındaki kayıt
+        """
+        path = self.path_for(record["user_id"])
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.serializer.dumps(record.get("memory") or {}))
+        os.replace(tmp_path, path)
+        if record.get("last_access"):
+            os.utime(path, (record["last_access"], record["last_access"]))
+        for other in self._user_files(record["user_id"])[1:]:
+            os.remove(other)
+
+    def _iter_legacy_files(self) -> Iterator[Tuple[str, str]]:
+        """
+        Eski dizindeki `memory_{user_id}.*` dosyalarını gezer.
+
+        Yields:
+            Tuple[str, str]: (kullanıcı kimliği, dosya yolu)
+        """
+        extensions = set(known_extensions())
+        root = os.path.abspath(self.root)
+        with os.scandir(self.legacy_dir) as entries:
+            for entry in entries:
+                name, extension = os.path.splitext(entry.name)
+                if (
+                    name.startswith(LEGACY_PREFIX) and extension in extensions
+                    and entry.is_file() and os.path.abspath(entry.path) != root
+                ):
+                    user_id = name[len(LEGACY_PREFIX):]
+                    try:
+                        self.check_user_id(user_id)
+                    except ValueError as e:
+                        print(f"⚠ {entry.name} taşınmadı: {str(e)}")
+                        continue
+                    yield user_id, entry.path
+
+    def migrate_legacy(self, batch_size: int = 1000) -> int:
+        """
+        Eski dizindeki tüm `memory_{user_id}.*` dosyalarını depoya taşır.
+
+        Dosyalar partiler halinde okunur, parça kilidi parti başına bir kez
+        alınır ve eski dosyanın değiştirilme zamanı son erişim zamanı olarak
+        korunur. Kullanıcının depoda (herhangi bir formatta) zaten bir dosyası
+        varsa o dosya geçerli kabul edilir, geçerli formata taşınır ve eski
+        dosya yalnızca silinir. Eski ".lock" dosyaları da temizlenir. Depoda
+        saklanamayan kimlikler (boş veya çok uzun) atlanır.
+
+        Args:
+            batch_size (int, optional): Parti büyüklüğü. Varsayılan 1000
+
+        Returns:
+            int: Taşınan kullanıcı sayısı
+        """
+        migrated = 0
+        legacy_files = self._iter_legacy_files()
+        while True:
+            batch = list(itertools.islice(legacy_files, batch_size))
+            if not batch:
+                return migrated
+            by_shard = {}
+            for user_id, legacy_path in batch:
+                by_shard.setdefault(self._shard_dir(user_id), []).append((user_id, legacy_path))
+            for shard_dir, entries in by_shard.items():
+                with file_lock(self._lock_path(shard_dir)):
+                    for user_id, legacy_path in entries:
+                        try:
+                            if not self._consolidate(user_id):
+                                self._write({
+                                    "user_id": user_id,
+                                    "last_access": os.path.getmtime(legacy_path),
+                                    "memory": self._read(legacy_path),
+                                })
+                                migrated += 1
+                            os.remove(legacy_path)
+                        except FileNotFoundError:
+                            # Bu arada `open` tarafından taşınmış
+                            continue
+                        for extension in known_extensions():
+                            lock_path = os.path.join(
+                                self.legacy_dir, f"{LEGACY_PREFIX}{user_id}{extension}.lock"
+                            )
+                            if os.path.exists(lock_path):
+                                os.remove(lock_path)
+
+    def sweep(self, max_idle_seconds: float, now: Optional[float] = None) -> int:
+        """
+        Son erişimi belirtilen süreden eski olan kullanıcıları siler.
+
+        Silmeden önce parça kilidi alınır ve erişim zamanı yeniden kontrol
+        edilir, böylece o sırada yazılan bir kullanıcı silinmez. Kullanıcının
+        tüm formatlardaki dosyaları birlikte silinir.
+
+        Args:
+            max_idle_seconds (float): En fazla hareketsizlik süresi (saniye)
+            now (float, optional): Şimdiki zaman. Varsayılan time.time()
+
+        Returns:
+            int: Silinen kullanıcı sayısı
+        """
+        cutoff = (now or time.time()) - max_idle_seconds
+        removed = 0
+        for user_id, path in self._iter_files():
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                with file_lock(self._lock_path(os.path.dirname(path))):
+                    files = self._user_files(user_id)
+                    if files and max(os.path.getmtime(f) for f in files) < cutoff:
+                        for f in files:
+                            os.remove(f)
+                        removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+class RetentionSweeper(threading.Thread):
+    """
+    Saklama temizleyicisini belirli aralıklarla arka planda çalıştıran thread.
+
+    Her worker bir temizleyici başlatabilir, ancak yalnızca depo düzeyindeki
+    ".sweeper.lock" kilidini (bloklamadan) alabilen süreç temizlik yapar.
+    Kilit süreç yaşadığı sürece tutulur; süreç kapanırsa başka bir worker
+    bir sonraki turda devralır. Her turda önce eski dosyalar taşınır, sonra
+    pasif kullanıcılar silinir.
+
+    Attributes:
+        store (MemoryStore): Temizlenecek depo
+        max_idle_seconds (float): En fazla hareketsizlik süresi (saniye)
+        interval (float): Temizlik aralığı (saniye)
+    """
+
+    def __init__(self, store: MemoryStore, max_idle_seconds: float, interval: float = 3600):
+        """
+        Args:
+            store (MemoryStore): Temizlenecek depo
+            max_idle_seconds (float): En fazla hareketsizlik süresi (saniye)
+            interval (float, optional): Temizlik aralığı. Varsayılan 1 saat
+        """
+        super().__init__(name="retention-sweeper", daemon=True)
+        self.store = store
+        self.max_idle_seconds = max_idle_seconds
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._leader_lock = None
+
+    def _is_leader(self) -> bool:
+        """
+        Temizlik yetkisini (depo düzeyindeki kilidi) almaya çalışır.
+
+        Returns:
+            bool: Bu süreç temizlik yapmalıysa True
+        """
+        if self._leader_lock is not None:
+            return True
+        lock_file = open(os.path.join(self.store.root, SWEEPER_LOCK_NAME), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+        self._leader_lock = lock_file
+        return True
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                if not self._is_leader():
+                    continue
+                self.store.migrate_legacy()
+                removed = self.store.sweep(self.max_idle_seconds)
+                if removed:
+                    print(f"🧹 {removed} pasif kullanıcının belleği silindi.")
+            except Exception as e:
+                print(f"⚠ Bellek temizliği sırasında hata oluştu: {str(e)}")
+
+    def stop(self) -> None:
+        """Temizleyiciyi durdurur ve temizlik kilidini bırakır."""
+        self._stop_event.set()
+        if self._leader_lock is not None:
+            self._leader_lock.close()
+            self._leader_lock = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Kullanıcı belleği yönetim araçları")
+    parser.add_argument("--root", help="Depo dizini (varsayılan MEMORY_DIR veya memory_store)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="JSONL olarak dışa aktar")
+    export_parser.add_argument("path", help="Çıktı dosyası ('-' standart çıktı)")
+    import_parser = subparsers.add_parser("import", help="JSONL dosyasından içe aktar")
+    import_parser.add_argument("path", help="Girdi dosyası")
+    import_parser.add_argument("--batch-size", type=int, default=1000)
+    sweep_parser = subparsers.add_parser("sweep", help="Pasif kullanıcıları sil")
+    sweep_parser.add_argument("--days", type=float, required=True, help="En fazla hareketsiz gün")
+    subparsers.add_parser("migrate", help="Eski memory_{user_id}.* dosyalarını depoya taşı")
+    subparsers.add_parser("count", help="Kullanıcı sayısını yazdır")
+    args = parser.parse_args()
+
+    store = MemoryStore(args.root)
+    if args.command == "export":
+        if args.path == "-":
+            count = store.export_jsonl(sys.stdout)
+        else:
+            with open(args.path, "w", encoding="utf-8") as f:
+                count = store.export_jsonl(f)
+        print(f"✓ {count} kullanıcı dışa aktarıldı.", file=sys.stderr)
+    elif args.command == "import":
+        with open(args.path, "r", encoding="utf-8") as f:
+            count = store.import_jsonl(f, batch_size=args.batch_size)
+        print(f"✓ {count} kullanıcı içe aktarıldı.")
+    elif args.command == "migrate":
+        print(f"✓ {store.migrate_legacy()} kullanıcı depoya taşındı.")
+    elif args.command == "sweep":
+        print(f"✓ {store.sweep(args.days * 86400)} kullanıcı silindi.")
+    else:
+        print(store.count())
+
+
+if __name__ == "__main__":
+    main()
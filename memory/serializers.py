@@ -0,0 +1,314 @@
+"""
+Serileştirici Modülü
+
+Bu modül, kullanıcı belleği ve önbellek kayıtlarını diske yazmak için
+takılabilir (pluggable) serileştiriciler sağlar. Eski okunaklı JSON formatının
+yanında msgpack tabanlı kompakt bir format ve kariyer planlarında sık tekrar
+eden anahtar/ifadeler için paylaşılan sözlüklü sıkıştırma desteklenir.
+
+msgpack ve zstandard kütüphaneleri opsiyoneldir. Yüklü değillerse sırasıyla
+kompakt JSON ve standart kütüphanedeki zlib (önceden tanımlı sözlük ile)
+kullanılır.
+"""
+
+import json
+import os
+import zlib
+from typing import Any, Dict
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    zstandard = None
+
+
+# Sıkıştırılmış kayıtların başındaki sihirli önek ve codec işaretleri.
+# Sürüm 1 kayıtlarında sözlük kimliği yoktur (her zaman 1 kabul edilir);
+# sürüm 2 kayıtlarında codec işaretinden sonra 1 baytlık sözlük kimliği gelir.
+MAGIC_V1 = b"CA\x01"
+MAGIC = b"CA\x02"
+CODEC_ZLIB = b"z"
+CODEC_ZSTD = b"s"
+
+# msgpack serileştiricisinin kayıt başına yazdığı iç format işaretleri.
+# Böylece msgpack yokken yazılan JSON kayıtları, msgpack sonradan
+# yüklendiğinde de doğru okunur.
+FORMAT_MSGPACK = b"M"
+FORMAT_JSON = b"J"
+
+# Kariyer planlarında ve bellek kayıtlarında sık tekrar eden anahtarlar ve
+# kalıp ifadeler. Sıkıştırıcı bu metni önceden görmüş gibi davranır, böylece
+# küçük kayıtlarda bile anahtarlar birkaç bayta iner.
+#
+# Bu, zstandard.train_dictionary ile eğitilmiş bir sözlük değil, elle yazılmış
+# ham içerik (raw content) sözlüğüdür: eğitim için depoda gerçek plan örnekleri
+# yoktur ve zlib geri dönüşü yalnızca ham içerik sözlüğü kullanabilir. Eğitilmiş
+# bir sözlük eklenecekse yeni bir kimlikle DICTIONARIES'e eklenmeli ve
+# DICTIONARY_ID güncellenmelidir; mevcut sözlükler asla değiştirilmemelidir,
+# aksi halde eski kayıtlar açılamaz.
+SHARED_DICTIONARY = (
+    "career_goal last_career_plan recommended_resources "
+    "\"adımlar\" \"gerekli_beceriler\" \"önerilen_egitim\" \"deneyim\" "
+    "title href body url description "
+    "Temel programlama becerilerini öğrenin. Proje geliştirin ve portfolyo oluşturun. "
+    "Staj veya gönüllü projelerde deneyim kazanın. Sertifika programlarına katılın. "
+    "İletişim becerileri, problem çözme, takım çalışması, analitik düşünme. "
+    "Üniversite lisans derecesi, online kurslar, bootcamp, sertifika, eğitim. "
+    "yıl deneyim, junior, senior, mühendis, geliştirici, uzman, yönetici, "
+    "veri bilimi, yazılım, yapay zeka, makine öğrenmesi, Python, SQL, "
+    "kariyer hedefi için kaynaklar https://www. .com/ .org/ "
+).encode("utf-8")
+
+DICTIONARIES = {1: SHARED_DICTIONARY}
+DICTIONARY_ID = 1
+
+
+class Serializer:
+    """
+    Serileştirici temel sınıfı.
+
+    Alt sınıflar Python nesnelerini bayt dizisine ve tersine dönüştürür.
+
+    Attributes:
+        name (str): Serileştiricinin kısa adı (ör. "json", "msgpack")
+        extension (str): Bu formatla yazılan dosyaların uzantısı
+    """
+
+    name = "base"
+    extension = ".bin"
+
+    @property
+    def backend(self) -> str:
+        """Gerçekte kullanılan format (geri dönüşler dahil)."""
+        return self.name
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Nesneyi bayt dizisine dönüştürür.
+
+        Args:
+            obj (Any): Serileştirilecek nesne
+
+        Returns:
+            bytes: Serileştirilmiş veri
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Bayt dizisini Python nesnesine dönüştürür.
+
+        Args:
+            data (bytes): Serileştirilmiş veri
+
+        Returns:
+            Any: Geri yüklenen nesne
+
+        Raises:
+            ValueError: Veri bozuk veya eksikse
+        """
+        raise NotImplementedError
+
+
+class JsonSerializer(Serializer):
+    """
+    Eski (okunaklı) JSON formatı.
+
+    Mevcut `memory_*.json` dosyalarının formatıdır; girintili ve Türkçe
+    karakterler korunarak yazılır.
+    """
+
+    name = "json"
+    extension = ".json"
+
+    def __init__(self, indent: int = 4):
+        """
+        Args:
+            indent (int, optional): Girinti miktarı. Varsayılan değer 4
+        """
+        self.indent = indent
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, indent=self.indent, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data.decode("utf-8"))
+
+
+class MsgpackSerializer(Serializer):
+    """
+    Kompakt ikili format.
+
+    msgpack yüklüyse onu kullanır; değilse boşluksuz JSON'a geri düşer. Her
+    kayıt hangi iç formatla yazıldığını belirten 1 baytlık bir önek taşır.
+    Öneksiz eski kayıtlar da okunabilir ("{" ile başlayanlar JSON kabul edilir).
+    """
+
+    name = "msgpack"
+    extension = ".mpk"
+
+    @property
+    def backend(self) -> str:
+        """Gerçekte kullanılan iç format ("msgpack" veya "json")."""
+        return "msgpack" if msgpack is not None else "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        if msgpack is not None:
+            return FORMAT_MSGPACK + msgpack.packb(obj, use_bin_type=True)
+        return FORMAT_JSON + json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        marker = data[:1]
+        if marker == FORMAT_JSON or marker == b"{":
+            payload = data[1:] if marker == FORMAT_JSON else data
+            return json.loads(payload.decode("utf-8"))
+        payload = data[1:] if marker == FORMAT_MSGPACK else data
+        if msgpack is None:
+            raise ValueError("Kayıt msgpack formatında fakat msgpack kütüphanesi yüklü değil.")
+        return msgpack.unpackb(payload, raw=False)
+
+
+class CompressedSerializer(Serializer):
+    """
+    Paylaşılan sözlükle sıkıştıran sarmalayıcı serileştirici.
+
+    İç serileştiricinin çıktısını zstandard (yüklüyse) veya zlib ile
+    paylaşılan sözlük kullanarak sıkıştırır. Her kayıt hangi codec ve hangi
+    sözlükle yazıldığını belirten bir önek taşır, böylece zstandard sonradan
+    kaldırılsa bile zlib ile yazılmış kayıtlar okunabilir.
+
+    Attributes:
+        inner (Serializer): Sıkıştırılacak veriyi üreten serileştirici
+        level (int): Sıkıştırma seviyesi
+    """
+
+    def __init__(self, inner: Serializer, level: int = 6):
+        """
+        Args:
+            inner (Serializer): İç serileştirici
+            level (int, optional): Sıkıştırma seviyesi. Varsayılan değer 6
+        """
+        self.inner = inner
+        self.level = level
+        self.name = f"{inner.name}+zdict"
+        self.extension = f"{inner.extension}z"
+        self._zstd_dicts = {}
+        if zstandard is not None:
+            self._zstd_dicts = {
+                dict_id: zstandard.ZstdCompressionDict(data, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+                for dict_id, data in DICTIONARIES.items()
+            }
+
+    @property
+    def backend(self) -> str:
+        """Gerçekte kullanılan iç format ve sıkıştırıcı (ör. "msgpack+zstd")."""
+        return f"{self.inner.backend}+{'zstd' if zstandard is not None else 'zlib'}"
+
+    def dumps(self, obj: Any) -> bytes:
+        raw = self.inner.dumps(obj)
+        header = MAGIC + (CODEC_ZSTD if zstandard is not None else CODEC_ZLIB) + bytes([DICTIONARY_ID])
+        if zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=self._zstd_dicts[DICTIONARY_ID])
+            return header + compressor.compress(raw)
+        compressor = zlib.compressobj(self.level, zdict=DICTIONARIES[DICTIONARY_ID])
+        return header + compressor.compress(raw) + compressor.flush()
+
+    def loads(self, data: bytes) -> Any:
+        if data.startswith(MAGIC) and len(data) >= len(MAGIC) + 2:
+            codec = data[len(MAGIC):len(MAGIC) + 1]
+            dict_id = data[len(MAGIC) + 1]
+            payload = data[len(MAGIC) + 2:]
+        elif data.startswith(MAGIC_V1) and len(data) >= len(MAGIC_V1) + 1:
+            codec = data[len(MAGIC_V1):len(MAGIC_V1) + 1]
+            dict_id = 1
+            payload = data[len(MAGIC_V1) + 1:]
+        else:
+            raise ValueError("Sıkıştırılmış kayıt başlığı bulunamadı veya eksik.")
+        if dict_id not in DICTIONARIES:
+            raise ValueError(f"Bilinmeyen sözlük kimliği: {dict_id}")
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise ValueError("Kayıt zstandard ile sıkıştırılmış fakat kütüphane yüklü değil.")
+            decompressor = zstandard.ZstdDecompressor(dict_data=self._zstd_dicts[dict_id])
+            try:
+                raw = decompressor.decompress(payload)
+            except zstandard.ZstdError as e:
+                raise ValueError(f"Sıkıştırılmış kayıt bozuk: {str(e)}") from e
+        elif codec == CODEC_ZLIB:
+            decompressor = zlib.decompressobj(zdict=DICTIONARIES[dict_id])
+            try:
+                raw = decompressor.decompress(payload) + decompressor.flush()
+            except zlib.error as e:
+                raise ValueError(f"Sıkıştırılmış kayıt bozuk: {str(e)}") from e
+        else:
+            raise ValueError(f"Bilinmeyen sıkıştırma codec'i: {codec!r}")
+        return self.inner.loads(raw)
+
+
+SERIALIZERS: Dict[str, Any] = {
+    "json": JsonSerializer,
+    "msgpack": MsgpackSerializer,
+    "msgpack+zdict": lambda: CompressedSerializer(MsgpackSerializer()),
+}
+
+# MEMORY_FORMAT çevre değişkeni ile seçilebilir
+DEFAULT_FORMAT = "msgpack+zdict"
+
+
+def get_serializer(name: str = None) -> Serializer:
+    """
+    Ada göre bir serileştirici döndürür.
+
+    Args:
+        name (str, optional): Serileştirici adı ("json", "msgpack",
+                              "msgpack+zdict"). Verilmezse MEMORY_FORMAT
+                              çevre değişkeni, o da yoksa varsayılan format
+                              kullanılır.
+
+    Returns:
+        Serializer: İstenen serileştirici
+
+    Raises:
+        ValueError: Bilinmeyen bir serileştirici adı verilirse
+    """
+    name = name or os.getenv("MEMORY_FORMAT", DEFAULT_FORMAT)
+    if name not in SERIALIZERS:
+        raise ValueError(
+            f"Bilinmeyen bellek formatı: {name}. Geçerli değerler: {', '.join(SERIALIZERS)}"
+        )
+    return SERIALIZERS[name]()
+
+
+def serializer_for_extension(extension: str) -> Serializer:
+    """
+    Dosya uzantısına göre o formatı okuyabilen serileştiriciyi döndürür.
+
+    Args:
+        extension (str): Dosya uzantısı (ör. ".json", ".mpkz")
+
+    Returns:
+        Serializer: Uzantıya karşılık gelen serileştirici
+
+    Raises:
+        ValueError: Uzantı hiçbir kayıtlı formata ait değilse
+    """
+    for factory in SERIALIZERS.values():
+        serializer = factory()
+        if serializer.extension == extension:
+            return serializer
+    raise ValueError(f"Bilinmeyen bellek dosyası uzantısı: {extension}")
+
+
+def known_extensions() -> list:
+    """
+    Kayıtlı tüm formatların dosya uzantılarını döndürür.
+
+    Returns:
+        list: Uzantı listesi (ör. [".json", ".mpk", ".mpkz"])
+    """
+    return [factory().extension for factory in SERIALIZERS.values()]
@@ -0,0 +1,207 @@
+"""
+Paylaşılan Önbellek Modülü
+
+Bu modül, birden fazla uvicorn worker süreci arasında paylaşılan bir
+anahtar-değer önbelleği sağlar. Varsayılan olarak yerel bir SQLite dosyası
+kullanılır; `SHARED_CACHE_URL` çevre değişkeni bir `redis://` adresi
+gösterirse aynı arayüzü sağlayan Redis (veya Redis uyumlu yerel bir sunucu)
+istemcisi döndürülür.
+
+Arayüz bilinçli olarak redis-py ile aynı tutulmuştur:
+    get, set(ex=...), delete, expire, incrbyfloat, scan_iter(match=...)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterator, Optional, Union
+
+
+class SQLiteCache:
+    """
+    SQLite tabanlı, süreçler arası paylaşılan önbellek.
+
+    WAL modu sayesinde okumalar yazmaları beklemez. Bağlantılar süreç ve
+    thread başına açılır; fork sonrasında ebeveynden miras kalan bağlantı
+    kullanılmaz. Çağrılar senkron olduğundan asenkron koddan
+    `asyncio.to_thread` ile kullanılmalıdır.
+
+    Attributes:
+        path (str): SQLite veritabanı dosyasının yolu
+        busy_timeout (float): Kilitli veritabanında en fazla bekleme süresi (saniye)
+    """
+
+    def __init__(self, path: str = ".cache/shared_cache.sqlite3", busy_timeout: float = 0.5):
+        """
+        Args:
+            path (str, optional): Veritabanı dosyası. Varsayılan ".cache/shared_cache.sqlite3"
+            busy_timeout (float, optional): Kilit bekleme süresi. Varsayılan 0.5 saniye
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Anahtarın değerini döndürür.
+
+        Args:
+            key (str): Anahtar
+
+        Returns:
+            Optional[bytes]: Değer. Anahtar yoksa veya süresi dolmuşsa None
+        """
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        now = time.time()
+        if expires_at is not None and expires_at < now:
+            # Bu arada başka bir worker'ın yazdığı taze değer silinmesin
+            self._connection().execute(
+                "DELETE FROM cache WHERE key = ? AND expires_at < ?", (key, now)
+            )
+            return None
+        return bytes(value)
+
+    def set(self, key: str, value: Union[bytes, str], ex: Optional[float] = None) -> bool:
+        """
+        Anahtara değer yazar.
+
+        Args:
+            key (str): Anahtar
+            value (Union[bytes, str]): Değer
+            ex (float, optional): Geçerlilik süresi (saniye). Verilmezse süresiz
+
+        Returns:
+            bool: Her zaman True (redis-py ile uyumluluk için)
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        expires_at = time.time() + ex if ex else None
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at)
+        )
+        return True
+
+    def delete(self, *keys: str) -> int:
+        """
+        Anahtarları siler.
+
+        Args:
+            *keys (str): Silinecek anahtarlar
+
+        Returns:
+            int: Silinen anahtar sayısı
+        """
+        conn = self._connection()
+        deleted = 0
+        for key in keys:
+            deleted += conn.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount
+        return deleted
+
+    def expire(self, key: str, seconds: float) -> bool:
+        """
+        Anahtarın geçerlilik süresini ayarlar.
+
+        Args:
+            key (str): Anahtar
+            seconds (float): Şimdiden itibaren geçerlilik süresi (saniye)
+
+        Returns:
+            bool: Anahtar varsa True
+        """
+        return self._connection().execute(
+            "UPDATE cache SET expires_at = ? WHERE key = ?", (time.time() + seconds, key)
+        ).rowcount > 0
+
+    def incrbyfloat(self, key: str, amount: float) -> float:
+        """
+        Anahtardaki sayısal değeri atomik olarak artırır.
+
+        Args:
+            key (str): Anahtar
+            amount (float): Artış miktarı
+
+        Returns:
+            float: Yeni değer
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            value = float(bytes(row[0]).decode("utf-8")) + amount if row else amount
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, NULL)",
+                (key, repr(value).encode("utf-8"))
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def scan_iter(self, match: str = "*") -> Iterator[str]:
+        """
+        Desenle eşleşen anahtarları döndürür.
+
+        Yalnızca redis'teki gibi "*" joker karakteri desteklenir.
+
+        Args:
+            match (str, optional): Anahtar deseni (ör. "metrics:*")
+
+        Yields:
+            str: Eşleşen anahtar
+        """
+        pattern = match.replace("[", "[[]").replace("?", "[?]")
+        rows = self._connection().execute(
+            "SELECT key FROM cache WHERE key GLOB ? AND (expires_at IS NULL OR expires_at >= ?)",
+            (pattern, time.time())
+        ).fetchall()
+        for (key,) in rows:
+            yield key
+
+
+def get_shared_cache(url: Optional[str] = None):
+    """
+    Yapılandırmaya göre paylaşılan önbellek istemcisini döndürür.
+
+    Args:
+        url (str, optional): "sqlite:///yol/dosya.sqlite3" veya "redis://host:port/0".
+                             Verilmezse SHARED_CACHE_URL çevre değişkeni kullanılır.
+
+    Returns:
+        SQLiteCache veya redis.Redis: Önbellek istemcisi
+
+    Raises:
+        ValueError: Desteklenmeyen bir adres verilirse
+    """
+    url = url or os.getenv("SHARED_CACHE_URL", "sqlite:///.cache/shared_cache.sqlite3")
+    if url.startswith("sqlite:///"):
+        return SQLiteCache(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        import redis
+        # Yavaş bir sunucu çağıranı uzun süre bekletmesin
+        return redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+    raise ValueError(f"Desteklenmeyen paylaşılan önbellek adresi: {url}")
@@ -2,17 +2,50 @@
 Kullanıcı Belleği Modülü
 
 Bu modül, kullanıcının kariyer hedeflerini ve planlarını kalıcı olarak 
-saklamak için bir bellek yönetim sistemi sağlar. Veriler JSON formatında 
-saklanır ve yönetilir.
+saklamak için bir bellek yönetim sistemi sağlar. Veriler takılabilir bir
+serileştirici ile (varsayılan olarak sıkıştırılmış msgpack) saklanır. Eski
+JSON formatındaki dosyalar ilk okumada otomatik olarak yeni formata taşınır.
 
 Yazar: Bartu
 Tarih: 21 Ocak 2026
 Versiyon: 1.0.0
 """
 
-import json
 import os
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows'ta dosya kilidi yoktur
+    fcntl = None
+
+from memory.serializers import (
+    JsonSerializer, Serializer, get_serializer, known_extensions, serializer_for_extension
+)
+
+
+@contextmanager
+def file_lock(lock_path: str) -> Iterator[None]:
+    """
+    Süreçler arası özel kilit alır.
+    
+    Birden fazla worker aynı dosyaya aynı anda yazmasın diye ayrı bir kilit
+    dosyası üzerinde flock kullanılır (veri dosyaları os.replace ile
+    değiştirildiği için kilit onların üzerinde tutulamaz). fcntl bulunmayan
+    platformlarda kilit alınmaz.
+    
+    Args:
+        lock_path (str): Kilit dosyasının yolu
+    """
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 class UserMemory:
@@ -20,57 +53,165 @@ class UserMemory:
     Kullanıcı belleği yönetim sınıfı.
     
     Bu sınıf, kullanıcının kariyer hedeflerini, planlarını ve diğer ilgili
-    bilgileri JSON dosyasında saklar ve yönetir. Bellek verileri anahtar-değer
+    bilgileri bir dosyada saklar ve yönetir. Bellek verileri anahtar-değer
     çiftleri şeklinde tutulur ve kalıcı depolama sağlar.
     
     Attributes:
-        file_path (str): Bellek verilerinin saklanacağı JSON dosyasının yolu
+        file_path (str): Bellek verilerinin saklandığı dosyanın yolu
+        legacy_path (Optional[str]): Taşınan eski dosyanın yolu (yoksa None)
+        lock_path (str): Yazmalarda kullanılan kilit dosyasının yolu
+        serializer (Serializer): Dosya formatını belirleyen serileştirici
         memory (dict): Bellekteki mevcut veri sözlüğü
     """
     
-    def __init__(self, file_path: str = "user_memory.json"):
+    def __init__(self, file_path: str = "user_memory.json", serializer: Optional[Serializer] = None,
+                 legacy_path: Optional[str] = None, lock_path: Optional[str] = None,
+                 touch: bool = False):
         """
         UserMemory sınıfının constructor fonksiyonu.
         
-        Belirtilen dosya yolunda bir JSON dosyası oluşturur veya mevcut olanı
-        yükler. Dosya yoksa boş bir JSON dosyası oluşturulur.
+        Dosya uzantısı serileştiriciye göre belirlenir (ör. "memory_x.json"
+        yerine "memory_x.mpkz"). Yeni formatta dosya yoksa verilen legacy_path
+        ve aynı adın diğer kayıtlı format uzantıları (".json", ".mpk", ".mpkz")
+        aranır; bulunan dosya kendi formatıyla okunur, yeni formatta yazılır ve
+        silinir. Böylece MEMORY_FORMAT değiştirildiğinde mevcut veriler
+        kaybolmaz. Hiçbiri yoksa boş bir bellek dosyası oluşturulur.
         
         Args:
             file_path (str, optional): Bellek dosyasının yolu. 
                                        Varsayılan değer "user_memory.json"
+            serializer (Serializer, optional): Kullanılacak serileştirici.
+                                               Verilmezse get_serializer()
+                                               ile seçilir.
+            legacy_path (str, optional): Diğer uzantılardan önce denenecek
+                                         eski dosyanın yolu. Format dosya
+                                         uzantısından belirlenir.
+            lock_path (str, optional): Kilit dosyasının yolu. Verilmezse
+                                       "<dosya>.lock" kullanılır.
+            touch (bool, optional): True ise dosyanın değiştirilme zamanı
+                                    (son erişim) kilit altında güncellenir.
+                                    Varsayılan False
+        """
+        self.serializer = serializer or get_serializer()
+        root, ext = os.path.splitext(file_path)
+        if ext == JsonSerializer.extension:
+            self.file_path = root + self.serializer.extension
+        else:
+            self.file_path = file_path
+        self.lock_path = lock_path or f"{self.file_path}.lock"
+
+        with self._lock():
+            self.legacy_path = None
+            if os.path.exists(self.file_path):
+                self.memory = self.load_memory()
+            elif self._find_legacy(file_path, legacy_path):
+                self.memory = self._migrate_legacy()
+            else:
+                self.memory = {}
+                self.save_memory()
+            if touch:
+                os.utime(self.file_path)
+
+    def _lock(self):
+        """
+        Bellek dosyası için süreçler arası özel kilit alır.
+        
+        Returns:
+            Kilidi tutan context manager (bkz. file_lock)
+        """
+        return file_lock(self.lock_path)
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict]:
+        """
+        Kilit altında oku-değiştir-yaz işlemi yapar.
+        
+        Kilit alındıktan sonra veriler diskten yeniden yüklenir, böylece başka
+        bir worker'ın bu arada yaptığı değişiklikler kaybolmaz. Blok
+        tamamlanınca veriler kaydedilir.
+        
+        Yields:
+            dict: Güncel bellek sözlüğü
+            
+        Example:
+            >>> memory = UserMemory()
+            >>> with memory.transaction() as data:
+            ...     data["progress"] = 80
+        """
+        with self._lock():
+            if os.path.exists(self.file_path):
+                self.memory = self.load_memory()
+            yield self.memory
+            self.save_memory()
+
+    def _find_legacy(self, file_path: str, legacy_path: Optional[str]) -> Optional[str]:
+        """
+        Taşınacak eski bir dosya arar ve bulursa `legacy_path`'e atar.
+        
+        Args:
+            file_path (str): Constructor'a verilen dosya yolu
+            legacy_path (str, optional): Önce denenecek eski dosya yolu
+            
+        Returns:
+            Optional[str]: Bulunan dosyanın yolu veya None
         """
-        self.file_path = file_path
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump({}, f)
-        self.memory = self.load_memory()
+        root = os.path.splitext(self.file_path)[0]
+        candidates = [legacy_path, file_path] + [root + ext for ext in known_extensions()]
+        for candidate in candidates:
+            if candidate and candidate != self.file_path and os.path.exists(candidate):
+                self.legacy_path = candidate
+                return candidate
+        return None
+
+    def _migrate_legacy(self) -> dict:
+        """
+        Eski dosyayı okuyup yeni formata ve konuma taşır.
+        
+        Yeni dosya başarıyla yazıldıktan sonra eski dosya silinir.
+        
+        Returns:
+            dict: Eski dosyadan yüklenen veriler
+        """
+        try:
+            legacy_serializer = serializer_for_extension(os.path.splitext(self.legacy_path)[1])
+        except ValueError:
+            legacy_serializer = self.serializer
+        with open(self.legacy_path, 'rb') as f:
+            memory = legacy_serializer.loads(f.read())
+        self.memory = memory
+        self.save_memory()
+        os.remove(self.legacy_path)
+        return memory
 
     def load_memory(self) -> dict:
         """
-        Bellekteki verileri JSON dosyasından yükler.
+        Bellekteki verileri dosyadan yükler.
         
         Returns:
             dict: Bellekte saklanan tüm veriler
             
         Raises:
-            json.JSONDecodeError: JSON dosyası geçersiz formatta ise
+            ValueError: Dosya geçersiz formatta ise
             IOError: Dosya okuma hatası oluşursa
         """
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(self.file_path, 'rb') as f:
+            return self.serializer.loads(f.read())
         
     def save_memory(self) -> None:
         """
-        Mevcut bellek verilerini JSON dosyasına kaydeder.
+        Mevcut bellek verilerini dosyaya kaydeder.
         
         Bellekteki tüm değişiklikler bu metod çağrıldığında dosyaya yazılır.
-        Türkçe karakterler korunarak kaydedilir.
+        Veriler önce geçici bir dosyaya yazılır ve ardından atomik olarak
+        yerine taşınır, böylece yarım kalmış bir yazma dosyayı bozmaz.
         
         Raises:
             IOError: Dosya yazma hatası oluşursa
         """
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.memory, f, indent=4, ensure_ascii=False)
+        tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.serializer.dumps(self.memory))
+        os.replace(tmp_path, self.file_path)
 
     def update_goal(self, goal: str) -> None:
         """
@@ -86,8 +227,8 @@ class UserMemory:
             >>> memory = UserMemory()
             >>> memory.update_goal("Yazılım Mühendisi olmak")
         """
-        self.memory['career_goal'] = goal
-        self.save_memory()
+        with self.transaction() as memory:
+            memory['career_goal'] = goal
 
     def update_memory(self, key: str, value: Any) -> None:
         """
@@ -105,8 +246,8 @@ class UserMemory:
             >>> memory.update_memory("completed_tasks", ["Görev 1", "Görev 2"])
             >>> memory.update_memory("progress", 75.5)
         """
-        self.memory[key] = value
-        self.save_memory()
+        with self.transaction() as memory:
+            memory[key] = value
 
     def get_memory(self, key: str) -> Optional[Any]:
         """
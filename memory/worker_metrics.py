@@ -0,0 +1,137 @@
+"""
+Worker Metrikleri Modülü
+
+Bu modül, her worker sürecinin istek sayısı ve süre metriklerini önce
+süreç içinde biriktirir, belirli aralıklarla paylaşılan önbelleğe yazar ve
+tüm worker'ların metriklerini tek bir raporda birleştirir. İstek başına
+paylaşılan önbelleğe yazılmadığı için ölçüm, istek süresine eklenmez.
+
+Anahtar formatı: "metrics:{worker_id}:{metrik_adı}"
+
+worker_id süreç kimliği ile sürecin başlama zamanından oluşur; böylece bir
+konteyner yeniden başladığında aynı pid'yi alan yeni süreç eski sürecin
+sayaçlarına eklenmez. Anahtarların süresi her yazmada yenilenir; kapanmış
+(veya `ttl` boyunca hiç istek almamış) worker'ların metrikleri bu süre
+sonunda raporlardan düşer.
+"""
+
+import os
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+
+PREFIX = "metrics:"
+
+
+class WorkerMetrics:
+    """
+    Süreç başına metrik toplayıcı.
+
+    Attributes:
+        cache: Paylaşılan önbellek (SQLiteCache veya redis.Redis)
+        flush_interval (float): Metriklerin paylaşılan önbelleğe yazılma aralığı (saniye)
+        ttl (float): Yazılmayan metriklerin önbellekte kalma süresi (saniye)
+    """
+
+    def __init__(self, cache, flush_interval: float = 5.0, ttl: float = 3600):
+        """
+        Args:
+            cache: Paylaşılan önbellek istemcisi
+            flush_interval (float, optional): Yazma aralığı. Varsayılan 5 saniye
+            ttl (float, optional): Metriklerin son yazmadan sonra geçerlilik
+                                   süresi. Varsayılan 1 saat
+        """
+        self.cache = cache
+        self.flush_interval = flush_interval
+        self.ttl = ttl
+        self._worker_pid = None
+        self._worker_id = None
+        self._pending: Dict[str, float] = defaultdict(float)
+        self._last_flush = time.monotonic()
+
+    @property
+    def worker_id(self) -> str:
+        """Süreç kimliği ve başlama zamanından oluşan worker kimliği ("{pid}-{zaman}")."""
+        pid = os.getpid()
+        # Fork edilen süreç ebeveynin kimliğini kullanmasın
+        if self._worker_pid != pid:
+            self._worker_pid = pid
+            self._worker_id = f"{pid}-{int(time.time() * 1000)}"
+        return self._worker_id
+
+    def observe(self, path: str, seconds: float) -> bool:
+        """
+        Tamamlanan bir isteği süreç içinde kaydeder.
+
+        Paylaşılan önbelleğe yazmaz; yazma zamanı geldiyse True döner ve
+        çağıran `drain` + `flush` ile (asenkron koddan bir thread'de) yazar.
+
+        Args:
+            path (str): İstek yolu (ör. "/chat")
+            seconds (float): İsteğin süresi
+
+        Returns:
+            bool: Metriklerin paylaşılan önbelleğe yazılma zamanı geldiyse True
+        """
+        self._pending[f"requests_total:{path}"] += 1
+        self._pending[f"request_seconds_total:{path}"] += seconds
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def drain(self) -> Dict[str, float]:
+        """
+        Biriken metrikleri alır ve sayaçları sıfırlar.
+
+        Event loop thread'inde çağrılmalıdır; böylece `observe` ile yarışmaz.
+
+        Returns:
+            Dict[str, float]: Yazılacak metrikler
+        """
+        pending, self._pending = self._pending, defaultdict(float)
+        self._last_flush = time.monotonic()
+        return pending
+
+    def flush(self, pending: Optional[Dict[str, float]] = None) -> None:
+        """
+        Metrikleri paylaşılan önbelleğe yazar.
+
+        Args:
+            pending (Dict[str, float], optional): `drain` ile alınmış metrikler.
+                                                  Verilmezse burada alınır.
+        """
+        if pending is None:
+            pending = self.drain()
+        worker_id = self.worker_id
+        for name, amount in pending.items():
+            key = f"{PREFIX}{worker_id}:{name}"
+            self.cache.incrbyfloat(key, amount)
+            self.cache.expire(key, int(self.ttl))
+
+    def aggregate(self, pending: Optional[Dict[str, float]] = None) -> dict:
+        """
+        Tüm worker'ların metriklerini birleştirir.
+
+        Bu süreçte henüz yazılmamış metrikler de önce yazılır.
+
+        Args:
+            pending (Dict[str, float], optional): `drain` ile alınmış metrikler
+
+        Returns:
+            dict: Sözlük
+                - total: Tüm worker'ların toplamı ({metrik_adı: değer})
+                - workers: Worker bazında metrikler ({worker_id: {metrik_adı: değer}})
+        """
+        self.flush(pending)
+        total: Dict[str, float] = defaultdict(float)
+        workers: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for key in self.cache.scan_iter(match=f"{PREFIX}*"):
+            if isinstance(key, bytes):
+                key = key.decode("utf-8")
+            value = self.cache.get(key)
+            if value is None:
+                continue
+            worker_id, name = key[len(PREFIX):].split(":", 1)
+            amount = float(value)
+            workers[worker_id][name] = amount
+            total[name] += amount
+        return {"total": dict(total), "workers": dict(workers)}
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Depo kökü (agents, memory, tools) testlerden import edilebilsin
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,133 @@
+"""
+Bellek deposu testleri.
+"""
+
+import io
+import json
+import os
+import time
+
+import pytest
+
+from memory.memory_store import MemoryStore, RetentionSweeper
+from memory.serializers import get_serializer
+
+
+def make_store(tmp_path, format_name="msgpack+zdict"):
+    return MemoryStore(
+        root=str(tmp_path / "memory_store"),
+        legacy_dir=str(tmp_path),
+        serializer=get_serializer(format_name),
+    )
+
+
+def export(store):
+    out = io.StringIO()
+    store.export_jsonl(out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_legacy_json_is_migrated_on_open(tmp_path):
+    (tmp_path / "memory_alice.json").write_text(json.dumps({"career_goal": "Veri Bilimci"}), encoding="utf-8")
+    store = make_store(tmp_path)
+
+    memory = store.open("alice")
+
+    assert memory.get_memory("career_goal") == "Veri Bilimci"
+    assert memory.file_path == store.path_for("alice")
+    assert not (tmp_path / "memory_alice.json").exists()
+
+
+def test_migrate_moves_all_legacy_files_and_keeps_last_access(tmp_path):
+    legacy = tmp_path / "memory_bob.json"
+    legacy.write_text(json.dumps({"career_goal": "DevOps"}), encoding="utf-8")
+    os.utime(legacy, (1000, 1000))
+    (tmp_path / "memory_carol.mpkz").write_bytes(get_serializer("msgpack+zdict").dumps({"career_goal": "SRE"}))
+    store = make_store(tmp_path)
+    assert store.count() == 0
+
+    assert store.migrate_legacy() == 2
+
+    records = {record["user_id"]: record for record in export(store)}
+    assert records["bob"] == {"user_id": "bob", "last_access": 1000.0, "memory": {"career_goal": "DevOps"}}
+    assert records["carol"]["memory"] == {"career_goal": "SRE"}
+    assert os.listdir(tmp_path) == ["memory_store"]
+
+
+def test_migrate_keeps_existing_shard_file_in_other_format(tmp_path):
+    make_store(tmp_path, "json").open("bob").update_memory("career_goal", "yeni")
+    (tmp_path / "memory_bob.json").write_text(json.dumps({"career_goal": "eski"}), encoding="utf-8")
+    store = make_store(tmp_path)
+
+    assert store.migrate_legacy() == 0
+
+    assert export(store)[0]["memory"] == {"career_goal": "yeni"}
+    assert sorted(os.listdir(os.path.dirname(store.path_for("bob")))) == [".lock", "bob.mpkz"]
+
+
+def test_import_under_new_format_replaces_other_format_file(tmp_path):
+    make_store(tmp_path, "json").open("bob").update_memory("career_goal", "eski")
+    store = make_store(tmp_path)
+
+    store.import_jsonl(io.StringIO(json.dumps({"user_id": "bob", "memory": {"career_goal": "yeni"}}) + "\n"))
+
+    assert store.count() == 1
+    assert [record["memory"] for record in export(store)] == [{"career_goal": "yeni"}]
+
+
+def test_users_in_both_formats_are_listed_once(tmp_path):
+    make_store(tmp_path, "json").open("bob").update_memory("career_goal", "json")
+    store = make_store(tmp_path)
+    # open eski dosyayı taşır; eski bir sürümün bıraktığı kopyayı elle geri koy
+    store.open("bob").update_memory("career_goal", "mpkz")
+    with open(make_store(tmp_path, "json").path_for("bob"), "w", encoding="utf-8") as f:
+        json.dump({"career_goal": "json"}, f)
+
+    assert store.count() == 1
+    assert [record["memory"] for record in export(store)] == [{"career_goal": "mpkz"}]
+
+
+def test_export_import_round_trip(tmp_path):
+    source = make_store(tmp_path / "a")
+    for user_id in ["alice", "bob/..", "çağrı", "..", "x" * 50]:
+        source.open(user_id).update_memory("career_goal", f"{user_id} hedefi")
+    records = export(source)
+
+    target = make_store(tmp_path / "b", "msgpack")
+    assert target.import_jsonl(io.StringIO("".join(json.dumps(r) + "\n" for r in records)), batch_size=2) == 5
+
+    assert sorted(export(target), key=lambda r: r["user_id"]) == sorted(records, key=lambda r: r["user_id"])
+
+
+@pytest.mark.parametrize("user_id", ["", "x" * 300])
+def test_unstorable_user_ids_are_rejected(tmp_path, user_id):
+    store = make_store(tmp_path)
+
+    with pytest.raises(ValueError):
+        store.open(user_id)
+
+
+def test_sweep_keeps_recently_touched_users(tmp_path):
+    store = make_store(tmp_path)
+    store.open("eski")
+    store.open("yeni")
+    old = time.time() - 10 * 86400
+    os.utime(store.path_for("eski"), (old, old))
+    os.utime(store.path_for("yeni"), (old, old))
+    store.open("yeni")
+
+    assert store.sweep(86400) == 1
+
+    assert list(store.iter_user_ids()) == ["yeni"]
+
+
+def test_only_one_sweeper_is_leader(tmp_path):
+    pytest.importorskip("fcntl")
+    store = make_store(tmp_path)
+    first, second = RetentionSweeper(store, 86400), RetentionSweeper(store, 86400)
+
+    assert first._is_leader()
+    assert not second._is_leader()
+    first.stop()
+    assert second._is_leader()
+    second.stop()
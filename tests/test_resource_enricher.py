@@ -0,0 +1,169 @@
+"""
+Kaynak zenginleştirme testleri.
+
+Testler yerel bir ThreadingHTTPServer'a karşı çalışır; internet bağlantısı
+gerektirmez.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from memory.shared_cache import SQLiteCache
+from tools.resource_enricher import PageMetadataCache, ResourceEnricher, canonicalize_url
+
+
+PAGE_HTML = (
+    "<html><head><title> Python Kursu </title>"
+    "<meta name=\"description\" content=\"Sıfırdan Python\"></head><body></body></html>"
+)
+
+STATUS_PATHS = {"/dead": 404, "/gone": 410, "/forbidden": 403, "/unavailable": 503}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = collections.Counter()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        self.hits[path] += 1
+        if path in STATUS_PATHS:
+            self.send_response(STATUS_PATHS[path])
+            self.end_headers()
+            return
+        if path == "/slow":
+            time.sleep(2)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(PAGE_HTML.encode("utf-8"))
+
+
+class _RecordingStore:
+    """Yazılan TTL değerlerini kaydeden bellek içi önbellek."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def reset_hits():
+    _Handler.hits.clear()
+
+
+def enrich(enricher, results):
+    async def run():
+        try:
+            return await enricher.enrich(results)
+        finally:
+            await enricher.aclose()
+    return asyncio.run(run())
+
+
+def test_canonicalize_url_ignores_scheme_www_tracking_and_fragment():
+    assert canonicalize_url("HTTPS://www.Example.com:443/kurs/?utm_source=x&b=2&a=1#giris") == \
+        canonicalize_url("http://example.com/kurs?a=1&b=2")
+    assert canonicalize_url("https://example.com:8080/kurs") == "example.com:8080/kurs"
+    assert canonicalize_url("https://example.com/kurs?id=1") != canonicalize_url("https://example.com/kurs?id=2")
+
+
+def test_duplicates_are_removed_and_metadata_added(server):
+    enricher = ResourceEnricher(cache=PageMetadataCache(_RecordingStore()), budget=5)
+    results = enrich(enricher, [
+        {"title": "", "href": f"{server}/page"},
+        {"title": "kopya", "href": f"{server}/page/?utm_source=ddg#top"},
+    ])
+
+    assert len(results) == 1
+    assert results[0]["title"] == "Python Kursu"
+    assert results[0]["description"] == "Sıfırdan Python"
+    assert results[0]["reachable"] is True
+    assert _Handler.hits["/page"] == 1
+
+
+@pytest.mark.parametrize("path", ["/dead", "/gone"])
+def test_dead_links_are_dropped(server, path):
+    enricher = ResourceEnricher(cache=PageMetadataCache(_RecordingStore()), budget=5)
+    results = enrich(enricher, [{"title": "ölü", "href": f"{server}{path}"}])
+
+    assert results == []
+
+
+@pytest.mark.parametrize("path", ["/forbidden", "/unavailable"])
+def test_blocked_or_unavailable_links_are_kept_and_cached_briefly(server, path):
+    store = _RecordingStore()
+    enricher = ResourceEnricher(cache=PageMetadataCache(store, ttl=86400), budget=5, unknown_ttl=60)
+    hit = {"title": "engelli", "href": f"{server}{path}"}
+    results = enrich(enricher, [hit])
+
+    assert results == [hit]
+    assert list(store.ttls.values()) == [60]
+
+
+def test_connection_refused_is_dropped_and_cached_briefly():
+    store = _RecordingStore()
+    enricher = ResourceEnricher(cache=PageMetadataCache(store, ttl=86400), budget=5, unknown_ttl=60)
+    results = enrich(enricher, [{"title": "kapalı", "href": "http://127.0.0.1:9/"}])
+
+    assert results == []
+    assert list(store.ttls.values()) == [60]
+
+
+@pytest.mark.parametrize("path", ["/dead", "/page"])
+def test_dead_and_live_links_are_cached_for_full_ttl(server, path):
+    store = _RecordingStore()
+    enricher = ResourceEnricher(cache=PageMetadataCache(store, ttl=86400), budget=5, unknown_ttl=60)
+    enrich(enricher, [{"title": "", "href": f"{server}{path}"}])
+
+    assert list(store.ttls.values()) == [86400]
+
+
+def test_slow_endpoint_stays_within_budget(server):
+    enricher = ResourceEnricher(cache=PageMetadataCache(_RecordingStore()), budget=0.5, request_timeout=5)
+    slow = {"title": "yavaş", "href": f"{server}/slow"}
+
+    start = time.perf_counter()
+    results = enrich(enricher, [slow, {"title": "", "href": f"{server}/page"}])
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert slow in results
+    assert any(r.get("reachable") for r in results)
+
+
+def test_cached_metadata_is_reused(server, tmp_path):
+    cache = PageMetadataCache(SQLiteCache(str(tmp_path / "cache.sqlite3")))
+    hit = {"title": "", "href": f"{server}/page"}
+
+    first = enrich(ResourceEnricher(cache=cache, budget=5), [hit])
+    second = enrich(ResourceEnricher(cache=cache, budget=5), [hit])
+
+    assert first == second
+    assert second[0]["title"] == "Python Kursu"
+    assert _Handler.hits["/page"] == 1
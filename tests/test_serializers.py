@@ -0,0 +1,69 @@
+"""
+Serileştirici ve bellek formatı geçişi testleri.
+"""
+
+import json
+import zlib
+
+import pytest
+
+from memory.serializers import (
+    CODEC_ZLIB, DICTIONARIES, MAGIC_V1, CompressedSerializer, MsgpackSerializer, get_serializer
+)
+from memory.user_memory import UserMemory
+
+
+MEMORY = {"career_goal": "Veri Bilimci", "last_career_plan": {"adımlar": ["Python öğrenin"]}}
+
+
+@pytest.mark.parametrize("name", ["json", "msgpack", "msgpack+zdict"])
+def test_round_trip(name):
+    serializer = get_serializer(name)
+    assert serializer.loads(serializer.dumps(MEMORY)) == MEMORY
+
+
+def test_v1_compressed_record_is_readable():
+    compressor = zlib.compressobj(6, zdict=DICTIONARIES[1])
+    raw = MsgpackSerializer().dumps(MEMORY)
+    record = MAGIC_V1 + CODEC_ZLIB + compressor.compress(raw) + compressor.flush()
+
+    assert CompressedSerializer(MsgpackSerializer()).loads(record) == MEMORY
+
+
+def test_untagged_json_record_is_readable():
+    record = json.dumps(MEMORY, ensure_ascii=False).encode("utf-8")
+    assert MsgpackSerializer().loads(record) == MEMORY
+
+
+def test_untagged_msgpack_record_is_readable():
+    msgpack = pytest.importorskip("msgpack")
+    assert MsgpackSerializer().loads(msgpack.packb(MEMORY, use_bin_type=True)) == MEMORY
+
+
+@pytest.mark.parametrize("record", [b"", b"CA\x02", b"CA\x02s", b"CA\x01", b"CA\x02s\x01bozuk", b"CA\x02z\x01bozuk"])
+def test_truncated_or_corrupt_compressed_record_raises_value_error(record):
+    with pytest.raises(ValueError):
+        get_serializer("msgpack+zdict").loads(record)
+
+
+def test_legacy_json_file_is_migrated(tmp_path):
+    legacy = tmp_path / "memory_alice.json"
+    legacy.write_text(json.dumps(MEMORY, ensure_ascii=False), encoding="utf-8")
+
+    memory = UserMemory(str(legacy), serializer=get_serializer("msgpack+zdict"))
+
+    assert memory.memory == MEMORY
+    assert memory.file_path == str(tmp_path / "memory_alice.mpkz")
+    assert not legacy.exists()
+
+
+def test_switching_format_migrates_existing_file(tmp_path):
+    path = str(tmp_path / "memory_alice.json")
+    first = UserMemory(path, serializer=get_serializer("msgpack+zdict"))
+    first.update_memory("career_goal", "Veri Bilimci")
+
+    second = UserMemory(path, serializer=get_serializer("msgpack"))
+
+    assert second.get_memory("career_goal") == "Veri Bilimci"
+    assert second.file_path.endswith(".mpk")
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock")) == ["memory_alice.mpk"]
@@ -0,0 +1,37 @@
+"""
+Worker metrikleri testleri.
+"""
+
+import time
+
+from memory.shared_cache import SQLiteCache
+from memory.worker_metrics import WorkerMetrics
+
+
+def test_workers_are_aggregated_separately(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    first, second = WorkerMetrics(cache), WorkerMetrics(cache)
+    # Aynı pid'ye sahip iki örnek: yeniden başlatılan konteynerdeki pid tekrarını taklit eder
+    first.observe("/chat", 1.0)
+    first.flush()
+    time.sleep(0.01)
+    second.observe("/chat", 2.0)
+    second.flush()
+
+    report = first.aggregate()
+
+    assert first.worker_id != second.worker_id
+    assert report["total"]["requests_total:/chat"] == 2
+    assert len(report["workers"]) == 2
+
+
+def test_stale_worker_metrics_expire(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    metrics = WorkerMetrics(cache, ttl=1)
+    metrics.observe("/chat", 1.0)
+    metrics.flush()
+    assert metrics.aggregate()["total"]["requests_total:/chat"] == 1
+
+    time.sleep(1.1)
+
+    assert metrics.aggregate() == {"total": {}, "workers": {}}
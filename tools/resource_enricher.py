@@ -0,0 +1,371 @@
+"""
+Kaynak Zenginleştirme Modülü
+
+Bu modül, arama motorundan gelen kaynak sonuçlarını zenginleştirir. URL'ler
+normalize edilerek aynı kaynağın farklı adresleri tekilleştirilir, ardından
+sayfaların başlık, açıklama ve erişilebilirlik bilgileri eşzamanlı olarak
+çekilir. Sonuçlar URL bazında, süre sınırlı (TTL) olarak worker'lar arası
+paylaşılan önbellekte saklanır.
+
+Zenginleştirme her zaman bir zaman bütçesiyle çalışır; bütçe içinde
+tamamlanamayan sonuçlar ham haliyle döndürülür, böylece `/chat` yanıt süresi
+bu aşama yüzünden uzamaz.
+"""
+
+import asyncio
+import hashlib
+import os
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from memory.serializers import Serializer, get_serializer
+from memory.shared_cache import get_shared_cache
+
+
+# Tekilleştirme sırasında yok sayılan izleme parametreleri
+TRACKING_PARAMS = {"fbclid", "gclid", "yclid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+# Sayfa meta verisi için okunacak en fazla bayt
+MAX_BODY_BYTES = 64 * 1024
+
+# Yalnızca bu durum kodları bağlantının kalıcı olarak ölü olduğunu gösterir.
+# 403/429/5xx gibi yanıtlar bot engeli veya geçici yoğunluk olabilir.
+DEAD_STATUS_CODES = {404, 410}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL'yi tekilleştirme için normalize eder.
+
+    Şema ve alan adı küçük harfe çevrilir, "www." öneki, varsayılan portlar,
+    fragment, izleme parametreleri ve sondaki "/" kaldırılır, sorgu
+    parametreleri sıralanır. http ve https aynı kaynak kabul edilir.
+
+    Args:
+        url (str): Normalize edilecek URL
+
+    Returns:
+        str: Karşılaştırma anahtarı olarak kullanılacak normalize URL
+
+    Example:
+        >>> canonicalize_url("HTTPS://www.Example.com:443/kurs/?utm_source=x#giris")
+        'example.com/kurs'
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, urlencode(query), "")).lstrip("/")
+
+
+class _MetadataParser(HTMLParser):
+    """HTML içinden <title> ve açıklama meta etiketlerini çıkaran ayrıştırıcı."""
+
+    def __init__(self):
+        super().__init__()
+        self.title = ""
+        self.description = ""
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta" and not self.description:
+            attrs = dict(attrs)
+            name = (attrs.get("name") or attrs.get("property") or "").lower()
+            if name in ("description", "og:description"):
+                self.description = (attrs.get("content") or "").strip()
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+
+
+def parse_metadata(html: str) -> Dict[str, str]:
+    """
+    HTML metninden sayfa başlığını ve açıklamasını çıkarır.
+
+    Args:
+        html (str): Sayfanın HTML içeriği
+
+    Returns:
+        Dict[str, str]: "title" ve "description" anahtarlarını içeren sözlük
+    """
+    parser = _MetadataParser()
+    try:
+        parser.feed(html)
+    except Exception:
+        pass
+    return {"title": " ".join(parser.title.split()), "description": parser.description}
+
+
+class PageMetadataCache:
+    """
+    URL bazında, süre sınırlı sayfa meta verisi önbelleği.
+
+    Kayıtlar paylaşılan önbellekte "page:{sha1(url)}" anahtarıyla ve TTL ile
+    tutulur, böylece tüm worker süreçleri aynı önbelleği kullanır. Kayıtlar
+    bellek modülündeki serileştiricilerle yazılır.
+
+    Attributes:
+        store: Paylaşılan önbellek (SQLiteCache veya redis.Redis)
+        ttl (float): Kayıtların geçerlilik süresi (saniye)
+        serializer (Serializer): Kayıt formatı
+    """
+
+    def __init__(self, store=None, ttl: float = 24 * 3600, serializer: Optional[Serializer] = None):
+        """
+        Args:
+            store (optional): Paylaşılan önbellek. Varsayılan get_shared_cache()
+            ttl (float, optional): Geçerlilik süresi (saniye). Varsayılan 1 gün
+            serializer (Serializer, optional): Kayıt formatı. Varsayılan get_serializer()
+        """
+        self.store = store if store is not None else get_shared_cache()
+        self.ttl = ttl
+        self.serializer = serializer or get_serializer()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return "page:" + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        URL için geçerli bir önbellek kaydı varsa döndürür.
+
+        Args:
+            url (str): Normalize edilmiş URL
+
+        Returns:
+            Optional[Dict[str, Any]]: Meta veri sözlüğü veya süresi dolmuşsa/yoksa None
+        """
+        value = self.store.get(self._key(url))
+        if value is None:
+            return None
+        try:
+            return self.serializer.loads(value)
+        except ValueError:
+            return None
+
+    def set(self, url: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        URL için meta veriyi önbelleğe yazar.
+
+        Args:
+            url (str): Normalize edilmiş URL
+            data (Dict[str, Any]): Saklanacak meta veri
+            ttl (float, optional): Bu kayda özel geçerlilik süresi. Varsayılan self.ttl
+        """
+        self.store.set(self._key(url), self.serializer.dumps(data), ex=int(ttl or self.ttl))
+
+
+class ResourceEnricher:
+    """
+    Arama sonuçlarını tekilleştiren ve sayfa meta verisiyle zenginleştiren sınıf.
+
+    Tek bir havuzlanmış (pooled) asenkron HTTP istemcisi tüm isteklerde
+    yeniden kullanılır. Her alan adına aynı anda en fazla `per_host_limit`
+    istek gönderilir.
+
+    Attributes:
+        cache (PageMetadataCache): Sayfa meta verisi önbelleği
+        budget (float): Bir zenginleştirme çağrısı için toplam süre (saniye)
+        request_timeout (float): Tek bir istek için zaman aşımı (saniye)
+        per_host_limit (int): Alan adı başına eşzamanlı istek sınırı
+        unknown_ttl (float): Erişilebilirliği belirsiz sonuçların önbellek süresi (saniye)
+    """
+
+    def __init__(self, cache: Optional[PageMetadataCache] = None, budget: float = None,
+                 request_timeout: float = 2.0, per_host_limit: int = 2, max_connections: int = 20,
+                 unknown_ttl: float = 300):
+        """
+        Args:
+            cache (PageMetadataCache, optional): Önbellek. Verilmezse
+                paylaşılan önbellek kullanılır.
+            budget (float, optional): Süre bütçesi. Verilmezse
+                ENRICH_BUDGET_SECONDS çevre değişkeni, o da yoksa 1.5 saniye
+            request_timeout (float, optional): İstek zaman aşımı. Varsayılan 2 saniye
+            per_host_limit (int, optional): Alan adı başına eşzamanlılık. Varsayılan 2
+            max_connections (int, optional): Havuzdaki en fazla bağlantı. Varsayılan 20
+            unknown_ttl (float, optional): Belirsiz sonuçların önbellek süresi. Varsayılan 5 dakika
+        """
+        self.cache = cache or PageMetadataCache()
+        self.budget = budget if budget is not None else float(os.getenv("ENRICH_BUDGET_SECONDS", "1.5"))
+        self.request_timeout = request_timeout
+        self.per_host_limit = per_host_limit
+        self.max_connections = max_connections
+        self.unknown_ttl = unknown_ttl
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.request_timeout),
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections // 2),
+                follow_redirects=True,
+                headers={"User-Agent": "KariyerAjani/1.0 (+https://kariyerajani.netlify.app)"},
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = (urlsplit(url).hostname or "").lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def aclose(self) -> None:
+        """Havuzlanmış HTTP istemcisini kapatır."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def dedupe(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize URL'si aynı olan sonuçları tekilleştirir.
+
+        İlk görülen sonuç korunur, sıralama değişmez.
+
+        Args:
+            results (List[Dict[str, Any]]): Ham arama sonuçları ("href" anahtarı ile)
+
+        Returns:
+            List[Dict[str, Any]]: Tekilleştirilmiş sonuçlar
+        """
+        seen = set()
+        unique = []
+        for result in results:
+            url = result.get("href") or result.get("url")
+            if not url:
+                continue
+            key = canonicalize_url(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(result)
+        return unique
+
+    async def fetch_metadata(self, url: str) -> Dict[str, Any]:
+        """
+        Tek bir sayfanın meta verisini çeker (önbellek öncelikli).
+
+        "reachable" değeri:
+            - True: sayfa yanıt verdi (HTTP < 400)
+            - False: sayfa ölü (404/410, DNS veya bağlantı hatası)
+            - None: belirsiz (403, 429, 5xx vb.)
+
+        Yalnızca 404/410 yanıtları ve başarılı yanıtlar tam süreyle önbelleğe
+        alınır. Bağlantı hataları sunucunun kendi ağ sorunundan da
+        kaynaklanabileceği için belirsiz yanıtlar gibi kısa süreli tutulur.
+
+        Args:
+            url (str): Sayfa adresi
+
+        Returns:
+            Dict[str, Any]: "title", "description" ve "reachable" anahtarlarını
+                            içeren sözlük
+
+        Raises:
+            httpx.TimeoutException: İstek zaman aşımına uğrarsa (önbelleğe yazılmaz)
+        """
+        key = canonicalize_url(url)
+        # Önbellek senkron (SQLite/redis-py); event loop'u bloklamasın.
+        # Önbelleğe erişilemezse (kilit, bağlantı hatası) kayıt yok sayılır.
+        try:
+            cached = await asyncio.to_thread(self.cache.get, key)
+        except Exception:
+            cached = None
+        if cached is not None:
+            return cached
+
+        metadata = {"title": "", "description": "", "reachable": None}
+        status_code = None
+        try:
+            async with self._host_semaphore(url):
+                async with self._get_client().stream("GET", url) as response:
+                    status_code = response.status_code
+                    if response.status_code < 400:
+                        metadata["reachable"] = True
+                    elif response.status_code in DEAD_STATUS_CODES:
+                        metadata["reachable"] = False
+                    content_type = response.headers.get("content-type", "")
+                    if metadata["reachable"] and "html" in content_type:
+                        body = b""
+                        async for chunk in response.aiter_bytes():
+                            body += chunk
+                            if len(body) >= MAX_BODY_BYTES:
+                                break
+                        html = body[:MAX_BODY_BYTES].decode(response.encoding or "utf-8", errors="replace")
+                        metadata.update(parse_metadata(html))
+        except httpx.TimeoutException:
+            # Zaman aşımı ölü bağlantı anlamına gelmez; önbelleğe yazılmaz
+            raise
+        except httpx.ConnectError:
+            # DNS çözümlenemedi veya bağlantı reddedildi
+            metadata["reachable"] = False
+        except httpx.HTTPError:
+            pass
+
+        ttl = None if metadata["reachable"] or status_code in DEAD_STATUS_CODES else self.unknown_ttl
+        try:
+            await asyncio.to_thread(self.cache.set, key, metadata, ttl)
+        except Exception as e:
+            print(f"⚠ Sayfa meta verisi önbelleğe yazılamadı: {str(e)}")
+        return metadata
+
+    async def enrich(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sonuçları tekilleştirir ve süre bütçesi içinde meta veriyle zenginleştirir.
+
+        Ölü olduğu kesinleşen (404/410, DNS veya bağlantı hatası) sonuçlar
+        listeden çıkarılır. Erişilebilirliği belirsiz olan, bütçe içinde
+        tamamlanamayan veya zaman aşımına uğrayan sonuçlar ham haliyle korunur.
+
+        Args:
+            results (List[Dict[str, Any]]): Ham arama sonuçları
+
+        Returns:
+            List[Dict[str, Any]]: Zenginleştirilmiş sonuçlar
+        """
+        unique = self.dedupe(results)
+        if not unique:
+            return []
+
+        tasks = [asyncio.ensure_future(self.fetch_metadata(r.get("href") or r.get("url"))) for r in unique]
+        done, pending = await asyncio.wait(tasks, timeout=self.budget)
+        for task in pending:
+            task.cancel()
+
+        enriched = []
+        for result, task in zip(unique, tasks):
+            if task not in done or task.cancelled() or task.exception() is not None:
+                enriched.append(result)
+                continue
+            metadata = task.result()
+            if metadata["reachable"] is False:
+                continue
+            if metadata["reachable"] is None:
+                enriched.append(result)
+                continue
+            item = dict(result)
+            item["title"] = result.get("title") or metadata["title"]
+            item["description"] = metadata["description"]
+            item["reachable"] = True
+            enriched.append(item)
+        return enriched